@@ -8,6 +8,7 @@ for each feature, using the feature's files and description.
 
 import sys
 import subprocess
+import traceback
 import yaml
 import click
 from pathlib import Path
@@ -211,7 +212,6 @@ def main(chromium_src, features_file):
         sys.exit(130)
     except Exception as e:
         log_error(f"\nError: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -4,6 +4,8 @@
 import os
 import sys
 import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -13,7 +15,7 @@ import typer
 from ..common.context import Context
 from ..common.config import load_config, validate_required_envs
 from ..common.pipeline import validate_pipeline, show_available_modules
-from ..common.resolver import resolve_config, resolve_pipeline
+from ..common.resolver import Phase, resolve_config, resolve_pipeline
 from ..common.notify import (
     notify_pipeline_start,
     notify_pipeline_end,
@@ -22,107 +24,98 @@ from ..common.notify import (
     notify_module_completion,
     set_build_context,
 )
-from ..common.module import ValidationError
+from ..common.module import LazyModuleRegistry, ValidationError
 from ..common.utils import (
+    flush_logs,
     log_error,
     log_info,
     log_success,
     log_warning,
-    IS_MACOS,
+    get_platform,
     IS_WINDOWS,
-    IS_LINUX,
 )
 
-# Import all module classes
-from ..modules.setup.clean import CleanModule
-from ..modules.setup.git import GitSetupModule, SparkleSetupModule
-from ..modules.setup.configure import ConfigureModule
-from ..modules.compile import CompileModule, UniversalBuildModule
-from ..modules.patches.patches import PatchesModule
-from ..modules.patches.series_patches import SeriesPatchesModule
-from ..modules.resources.chromium_replace import ChromiumReplaceModule
-from ..modules.resources.string_replaces import StringReplacesModule
-from ..modules.resources.resources import ResourcesModule
-from ..modules.extensions import BundledExtensionsModule
-from ..modules.storage import UploadModule, DownloadResourcesModule
-
-# Platform-specific modules (imported unconditionally - validation handles platform checks)
-from ..modules.sign.macos import MacOSSignModule
-from ..modules.sign.windows import WindowsSignModule
-from ..modules.sign.linux import LinuxSignModule
-from ..modules.sign.sparkle import SparkleSignModule
-from ..modules.package.macos import MacOSPackageModule
-from ..modules.package.windows import WindowsPackageModule
-from ..modules.package.linux import LinuxPackageModule
-
-AVAILABLE_MODULES = {
-    # Setup & Environment
-    "clean": CleanModule,
-    "git_setup": GitSetupModule,
-    "sparkle_setup": SparkleSetupModule,
-    "configure": ConfigureModule,
-    # Patches & Resources
-    "patches": PatchesModule,
-    "series_patches": SeriesPatchesModule,
-    "chromium_replace": ChromiumReplaceModule,
-    "string_replaces": StringReplacesModule,
-    "download_resources": DownloadResourcesModule,  # Download binaries from R2
-    "resources": ResourcesModule,
-    "bundled_extensions": BundledExtensionsModule,
-    # Build
-    "compile": CompileModule,
-    "universal_build": UniversalBuildModule,  # macOS universal binary (arm64 + x64)
-    # Sign (platform-specific, validated at runtime)
-    "sign_macos": MacOSSignModule,
-    "sign_windows": WindowsSignModule,
-    "sign_linux": LinuxSignModule,
-    "sparkle_sign": SparkleSignModule,  # macOS Sparkle signing for auto-update
-    # Package (platform-specific, validated at runtime)
-    "package_macos": MacOSPackageModule,
-    "package_windows": WindowsPackageModule,
-    "package_linux": LinuxPackageModule,
-    # Storage (upload/download)
-    "upload": UploadModule,
+AVAILABLE_MODULES = LazyModuleRegistry(
+    {
+        # Setup & Environment
+        "clean": "..modules.setup.clean:CleanModule",
+        "git_setup": "..modules.setup.git:GitSetupModule",
+        "sparkle_setup": "..modules.setup.git:SparkleSetupModule",
+        "configure": "..modules.setup.configure:ConfigureModule",
+        # Patches & Resources
+        "patches": "..modules.patches.patches:PatchesModule",
+        "series_patches": "..modules.patches.series_patches:SeriesPatchesModule",
+        "chromium_replace": "..modules.resources.chromium_replace:ChromiumReplaceModule",
+        "string_replaces": "..modules.resources.string_replaces:StringReplacesModule",
+        "download_resources": "..modules.storage.download:DownloadResourcesModule",  # Download binaries from R2
+        "resources": "..modules.resources.resources:ResourcesModule",
+        "bundled_extensions": "..modules.extensions.bundled_extensions:BundledExtensionsModule",
+        # Build
+        "compile": "..modules.compile.standard:CompileModule",
+        "universal_build": "..modules.compile.universal:UniversalBuildModule",  # macOS universal binary (arm64 + x64)
+        # Sign (platform-specific, validated at runtime)
+        "sign_macos": "..modules.sign.macos:MacOSSignModule",
+        "sign_windows": "..modules.sign.windows:WindowsSignModule",
+        "sign_linux": "..modules.sign.linux:LinuxSignModule",
+        "sparkle_sign": "..modules.sign.sparkle:SparkleSignModule",  # macOS Sparkle signing for auto-update
+        # Package (platform-specific, validated at runtime)
+        "package_macos": "..modules.package.macos:MacOSPackageModule",
+        "package_windows": "..modules.package.windows:WindowsPackageModule",
+        "package_linux": "..modules.package.linux:LinuxPackageModule",
+        # Storage (upload/download)
+        "upload": "..modules.storage.upload:UploadModule",
+    },
+    __package__,
+)
+
+
+# Platform-specific module names, keyed by get_platform()
+SIGN_MODULES = {
+    "macos": "sign_macos",
+    "windows": "sign_windows",
+    "linux": "sign_linux",
+}
+PACKAGE_MODULES = {
+    "macos": "package_macos",
+    "windows": "package_windows",
+    "linux": "package_linux",
+}
+PLATFORM_DISPLAY_NAMES = {
+    "macos": "macOS",
+    "windows": "Windows",
+    "linux": "Linux",
 }
 
 
 def _get_sign_module():
     """Get platform-specific sign module name"""
-    if IS_MACOS():
-        return "sign_macos"
-    elif IS_WINDOWS():
-        return "sign_windows"
-    elif IS_LINUX():
-        return "sign_linux"
-    else:
+    module_name = SIGN_MODULES.get(get_platform())
+    if module_name is None:
         log_error("Unsupported platform for packaging")
         sys.exit(1)
+    return module_name
 
 
 def _get_package_module():
     """Get platform-specific package module name"""
-    if IS_MACOS():
-        return "package_macos"
-    elif IS_WINDOWS():
-        return "package_windows"
-    elif IS_LINUX():
-        return "package_linux"
-    else:
+    module_name = PACKAGE_MODULES.get(get_platform())
+    if module_name is None:
         log_error("Unsupported platform for packaging")
         sys.exit(1)
+    return module_name
 
 
 # Fixed execution order - flags enable/disable phases, order is always the same
 EXECUTION_ORDER = [
     # Phase 1: Setup & Clean
-    ("setup", ["clean", "git_setup", "sparkle_setup"]),
+    (Phase.SETUP, ["clean", "git_setup", "sparkle_setup"]),
     # Phase 2: Patches & Resources
     (
-        "prep",
+        Phase.PREP,
         [
             "download_resources",
-            "resources",
             "bundled_extensions",
+            "resources",
             "chromium_replace",
             "string_replaces",
             "patches",
@@ -130,35 +123,98 @@ EXECUTION_ORDER = [
         ],
     ),
     # Phase 3: Build
-    ("build", ["compile"]),
+    (Phase.BUILD, ["compile"]),
     # Phase 4: Code Signing (platform-aware)
-    ("sign", [_get_sign_module()]),
+    (Phase.SIGN, [_get_sign_module()]),
     # Phase 5: Packaging (platform-aware)
-    ("package", [_get_package_module()]),
+    (Phase.PACKAGE, [_get_package_module()]),
     # Phase 6: Upload
-    ("upload", ["upload"]),
+    (Phase.UPLOAD, ["upload"]),
 ]
 
-# Modules that trigger Slack notifications (to reduce verbosity)
-NOTIFY_MODULES = [
-    "compile",
-    "sign_macos",
-    "sign_windows",
-    "sign_linux",
-    "package_macos",
-    "package_windows",
-    "package_linux",
-    "upload",
-]
+# Phases whose single module is picked per platform (shown as "phase (→ module)")
+PLATFORM_PHASES = frozenset({Phase.SIGN, Phase.PACKAGE})
+
+# Modules that trigger Slack notifications (to reduce verbosity); a frozenset
+# since it is only ever used for membership checks around each module run
+NOTIFY_MODULES = frozenset(
+    {
+        "compile",
+        "sign_macos",
+        "sign_windows",
+        "sign_linux",
+        "package_macos",
+        "package_windows",
+        "package_linux",
+        "upload",
+    }
+)
+
+
+def _group_parallel_batches(modules: list[tuple]) -> list[list[tuple]]:
+    """Group consecutive parallel_safe modules into batches.
+
+    Takes (name, module_class) pairs and reads only class-level metadata.
+    Modules that are not parallel_safe always end up in a batch of their own,
+    so pipeline order is preserved around them.
+    """
+    batches: list[list[tuple]] = []
+    for name, module_class in modules:
+        if module_class.parallel_safe and batches and batches[-1][-1][1].parallel_safe:
+            batches[-1].append((name, module_class))
+        else:
+            batches.append([(name, module_class)])
+    return batches
+
+
+def _run_module(ctx: Context, module_name: str, module, pipeline_name: str) -> None:
+    """Validate and execute a single module, raising typer.Exit on failure."""
+    log_info(f"\n{'='*70}")
+    log_info(f"🔧 Running module: {module_name}")
+    log_info(f"{'='*70}")
+    flush_logs()
+
+    # Notify module start and track timing (only for key modules)
+    if module_name in NOTIFY_MODULES:
+        notify_module_start(module_name)
+    module_start = time.time()
+
+    # Validate right before executing (fail fast)
+    try:
+        supported_platforms = module.supported_platforms
+        if supported_platforms and get_platform() not in supported_platforms:
+            supported = ", ".join(
+                PLATFORM_DISPLAY_NAMES[p] for p in sorted(supported_platforms)
+            )
+            raise ValidationError(f"{module_name} requires {supported}")
+        module.validate(ctx)
+    except ValidationError as e:
+        log_error(f"Validation failed for {module_name}: {e}")
+        notify_pipeline_error(pipeline_name, f"{module_name} validation failed: {e}")
+        raise typer.Exit(1)
+
+    # Execute module
+    try:
+        module.execute(ctx)
+        module_duration = time.time() - module_start
+        if module_name in NOTIFY_MODULES:
+            notify_module_completion(module_name, module_duration)
+        log_success(f"Module {module_name} completed in {module_duration:.1f}s")
+    except Exception as e:
+        log_error(f"Module {module_name} failed: {e}")
+        notify_pipeline_error(pipeline_name, f"{module_name} failed: {e}")
+        raise typer.Exit(1)
+    finally:
+        flush_logs()
 
 
 def execute_pipeline(
     ctx: Context,
     pipeline: list[str],
-    available_modules: dict,
+    available_modules: Mapping,
     pipeline_name: str = "build",
 ) -> None:
-    """Execute a build pipeline by running modules sequentially.
+    """Execute a build pipeline in order, overlapping independent modules.
 
     Args:
         ctx: Build context with paths and configuration
@@ -170,7 +226,9 @@ def execute_pipeline(
         typer.Exit: On module validation failure, execution failure, or interrupt
 
     Design:
-        - Executes modules sequentially in pipeline order
+        - Resolves all module classes up front (a typo fails before anything
+          runs), then instantiates each module only when it is about to run
+        - Adjacent modules marked parallel_safe run concurrently in threads
         - Validates each module before execution (fail fast)
         - Tracks timing for each module and total pipeline
         - Sends notifications at key lifecycle events
@@ -180,41 +238,26 @@ def execute_pipeline(
     notify_pipeline_start(pipeline_name, pipeline)
 
     try:
-        for module_name in pipeline:
-            log_info(f"\n{'='*70}")
-            log_info(f"🔧 Running module: {module_name}")
-            log_info(f"{'='*70}")
-
-            # Instantiate module
-            module_class = available_modules[module_name]
-            module = module_class()
-
-            # Notify module start and track timing (only for key modules)
-            if module_name in NOTIFY_MODULES:
-                notify_module_start(module_name)
-            module_start = time.time()
-
-            # Validate right before executing (fail fast)
-            try:
-                module.validate(ctx)
-            except ValidationError as e:
-                log_error(f"Validation failed for {module_name}: {e}")
-                notify_pipeline_error(
-                    pipeline_name, f"{module_name} validation failed: {e}"
-                )
-                raise typer.Exit(1)
-
-            # Execute module
-            try:
-                module.execute(ctx)
-                module_duration = time.time() - module_start
-                if module_name in NOTIFY_MODULES:
-                    notify_module_completion(module_name, module_duration)
-                log_success(f"Module {module_name} completed in {module_duration:.1f}s")
-            except Exception as e:
-                log_error(f"Module {module_name} failed: {e}")
-                notify_pipeline_error(pipeline_name, f"{module_name} failed: {e}")
-                raise typer.Exit(1)
+        # Resolve every module class before anything runs
+        modules = [(name, available_modules[name]) for name in pipeline]
+
+        for batch in _group_parallel_batches(modules):
+            if len(batch) == 1:
+                module_name, module_class = batch[0]
+                _run_module(ctx, module_name, module_class(), pipeline_name)
+                continue
+
+            names = ", ".join(name for name, _ in batch)
+            log_info(f"\n⚡ Running independent modules in parallel: {names}")
+            with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+                futures = [
+                    executor.submit(
+                        _run_module, ctx, name, module_class(), pipeline_name
+                    )
+                    for name, module_class in batch
+                ]
+                for future in futures:
+                    future.result()
 
         # Pipeline completed successfully
         duration = time.time() - start_time
@@ -388,7 +431,6 @@ def main(
     config_data = load_config(config) if config else None
 
     # Build CLI arguments dictionary for resolver
-    root_dir = Path(__file__).parent.parent.parent
     cli_args = {
         "chromium_src": chromium_src,
         "arch": arch,
@@ -424,23 +466,16 @@ def main(
     if has_flags:
         log_info("\n📋 Execution Plan (auto-ordered):")
         log_info("-" * 70)
-        phase_names = []
-        if setup:
-            phase_names.append("setup")
         if prep:
-            phase_names.append("prep")
             log_warning("⚠️  --prep does NOT apply series_patches. Run 'browseros build -m series_patches' separately if needed.")
-        if build:
-            phase_names.append("build")
-        if sign:
-            phase_names.append(f"sign (→ {_get_sign_module()})")
-        if package:
-            phase_names.append(f"package (→ {_get_package_module()})")
-        if upload:
-            phase_names.append("upload")
-
-        for phase_name in phase_names:
-            log_info(f"  ✓ {phase_name}")
+
+        for phase_name, phase_modules in EXECUTION_ORDER:
+            if not cli_args[phase_name]:
+                continue
+            if phase_name in PLATFORM_PHASES:
+                log_info(f"  ✓ {phase_name} (→ {phase_modules[0]})")
+            else:
+                log_info(f"  ✓ {phase_name}")
 
         log_info(f"\n  Pipeline: {' → '.join(pipeline)}")
         log_info("-" * 70)
@@ -459,7 +494,7 @@ def main(
         os.environ["DEPOT_TOOLS_WIN_TOOLCHAIN"] = "0"
         log_info("Set DEPOT_TOOLS_WIN_TOOLCHAIN=0 for Windows build")
 
-    log_info(f"📍 Root: {root_dir}")
+    log_info(f"📍 Root: {ctx.root_dir}")
     log_info(f"📍 Chromium: {ctx.chromium_src}")
     log_info(f"📍 Architecture: {ctx.architecture}")
     log_info(f"📍 Build type: {ctx.build_type}")
@@ -471,7 +506,7 @@ def main(
     log_info("=" * 70)
 
     # Set notification context for OS and architecture
-    os_name = "macOS" if IS_MACOS() else "Windows" if IS_WINDOWS() else "Linux"
+    os_name = PLATFORM_DISPLAY_NAMES.get(get_platform(), "Linux")
     set_build_context(os_name, ctx.architecture)
 
     # Execute pipeline
@@ -6,7 +6,6 @@ A git-like patch management system for maintaining patches against Chromium.
 Enables extracting, applying, and managing patches across Chromium upgrades.
 """
 
-import yaml
 from pathlib import Path
 from typing import Optional
 
@@ -15,7 +14,8 @@ from typer import Typer, Option, Argument
 
 # Import from common and utils
 from ..common.context import Context
-from ..common.utils import log_info, log_error, log_success, log_warning
+from ..common.resolver import validate_chromium_src
+from ..common.utils import log_info, log_error, log_success, log_warning, iter_files
 
 
 def create_build_context(chromium_src: Optional[Path] = None) -> Optional[Context]:
@@ -28,17 +28,14 @@ def create_build_context(chromium_src: Optional[Path] = None) -> Optional[Contex
             )
             return None
 
-        if not chromium_src.exists():
-            log_error(f"Chromium source directory does not exist: {chromium_src}")
+        try:
+            chromium_src = validate_chromium_src(str(chromium_src), "DEV")
+        except ValueError as e:
+            log_error(str(e))
             return None
 
-        ctx = Context(
-            chromium_src=chromium_src,
-            architecture="",  # Not needed for patch operations
-            build_type="debug",  # Not needed for patch operations
-        )
-
-        return ctx
+        # Architecture and build type are not needed for patch operations
+        return Context.init_context({"chromium_src": chromium_src})
     except Exception as e:
         log_error(f"Failed to create build context: {e}")
         return None
@@ -113,7 +110,9 @@ def status():
         # Check for patches directory
         patches_dir = build_ctx.root_dir / "chromium_patches"
         if patches_dir.exists():
-            patch_count = len(list(patches_dir.rglob("*.patch")))
+            patch_count = sum(
+                1 for entry in iter_files(patches_dir) if entry.name.endswith(".patch")
+            )
             log_info(f"Individual patches: {patch_count}")
         else:
             log_warning("No patches directory found")
@@ -121,10 +120,11 @@ def status():
         # Check for features.yaml
         features_file = build_ctx.root_dir / "features.yaml"
         if features_file.exists():
-            with open(features_file) as f:
-                features = yaml.safe_load(f)
-                feature_count = len(features.get("features", {}))
-                log_info(f"Features defined: {feature_count}")
+            from ..modules.feature.select import load_features_yaml
+
+            features = load_features_yaml(features_file, mutable=False)
+            feature_count = len(features.get("features", {}))
+            log_info(f"Features defined: {feature_count}")
         else:
             log_warning("No features.yaml found")
     else:
@@ -10,14 +10,7 @@ from ..common.context import Context
 from ..common.module import ValidationError
 from ..common.utils import log_info, log_error, log_success
 
-from ..modules.release import (
-    AVAILABLE_MODULES,
-    ListModule,
-    AppcastModule,
-    GithubModule,
-    PublishModule,
-    DownloadModule,
-)
+from ..modules.release import AVAILABLE_MODULES
 
 app = typer.Typer(
     help="Release automation commands",
@@ -39,9 +32,10 @@ def create_release_context(
     repo: Optional[str] = None,
 ) -> Context:
     """Create Context for release operations"""
+    cwd = Path.cwd()
     ctx = Context(
-        root_dir=Path.cwd(),
-        chromium_src=Path.cwd(),  # Not used for release ops
+        root_dir=cwd,
+        chromium_src=cwd,  # Not used for release ops
         architecture="",
         build_type="release",
     )
@@ -150,19 +144,19 @@ def main(
             log_info(f"📋 Listing artifacts for v{version}")
         else:
             log_info("📋 Listing all available releases")
-        execute_module(release_ctx, ListModule())
+        execute_module(release_ctx, AVAILABLE_MODULES["list"]())
 
     if appcast:
         log_info(f"📝 Generating appcast for v{version}")
-        execute_module(release_ctx, AppcastModule())
+        execute_module(release_ctx, AVAILABLE_MODULES["appcast"]())
 
     if publish:
         log_info(f"🚀 Publishing v{version} to download/ paths")
-        execute_module(release_ctx, PublishModule())
+        execute_module(release_ctx, AVAILABLE_MODULES["publish"]())
 
     if download:
         log_info(f"📥 Downloading artifacts for v{version}")
-        execute_module(release_ctx, DownloadModule(os_filter=os_filter, output_dir=output))
+        execute_module(release_ctx, AVAILABLE_MODULES["download"](os_filter=os_filter, output_dir=output))
 
 
 @github_app.command("create")
@@ -197,7 +191,7 @@ def github_create(
     ctx = create_release_context(version, repo)
 
     log_info(f"🚀 Creating GitHub release for v{version}")
-    module = GithubModule(
+    module = AVAILABLE_MODULES["github"](
         draft=draft,
         skip_upload=skip_upload,
         title=title,
@@ -206,7 +200,7 @@ def github_create(
 
     if publish_to_download:
         log_info(f"\n🚀 Publishing v{version} to download/ paths")
-        execute_module(ctx, PublishModule())
+        execute_module(ctx, AVAILABLE_MODULES["publish"]())
 
 
 if __name__ == "__main__":
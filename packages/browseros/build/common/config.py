@@ -3,10 +3,19 @@
 
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
+from .env import EnvConfig
 from .utils import log_info, log_error, log_warning
 
+# Parse with libyaml's C loader when PyYAML was built with it; the pure-Python
+# SafeLoader is several times slower on larger configs
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def env_var_constructor(loader, node):
     """Custom YAML constructor for !env tag
@@ -27,8 +36,9 @@ def env_var_constructor(loader, node):
     return env_value
 
 
-# Register the !env constructor with SafeLoader
+# Register the !env constructor with SafeLoader and the loader load_config uses
 yaml.add_constructor('!env', env_var_constructor, Loader=yaml.SafeLoader)
+yaml.add_constructor('!env', env_var_constructor, Loader=_YamlLoader)
 
 
 def load_config(config_path: Path) -> Dict[str, Any]:
@@ -45,21 +55,35 @@ def load_config(config_path: Path) -> Dict[str, Any]:
     log_info(f"Loading config from: {config_path}")
 
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
 
     return config
 
 
+@lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file; keyed by mtime and size so edits invalidate it."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Load a YAML data file, parsing it at most once per file version
+
+    Repeated loads in one process (e.g. copy_resources.yaml for each
+    architecture of a universal build) share the parsed data, so callers
+    must treat the result as read-only.
+    """
+    stat = path.stat()
+    return _parse_yaml_file(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def validate_required_envs(required_envs: list) -> None:
     """Validate that all required environment variables are set
     
     Raises SystemExit if any are missing
     """
-    missing = []
-    for env_var in required_envs:
-        if not os.environ.get(env_var):
-            missing.append(env_var)
-    
+    missing = EnvConfig.missing_vars(*required_envs)
     if missing:
         log_error("Missing required environment variables:")
         for var in missing:
@@ -8,8 +8,9 @@ The old interface is maintained for backward compatibility during the migration.
 """
 
 import time
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Dict, List, Optional
 from .utils import (
     get_platform,
@@ -23,6 +24,33 @@ from .env import EnvConfig
 from .paths import get_package_root
 
 
+@lru_cache(maxsize=None)
+def _read_version_file(version_file: Path) -> str:
+    """Read a version file once per process, "" if missing
+
+    Every Context (including per-architecture and release/OTA contexts) reads
+    the same version files, so their contents are shared across instances.
+    """
+    try:
+        return version_file.read_text().strip()
+    except FileNotFoundError:
+        return ""
+
+
+# EnvConfig is a stateless view of os.environ; one instance serves every
+# Context, including per-architecture copies from for_architecture()
+_SHARED_ENV = EnvConfig()
+
+
+def _parse_version_values(content: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a version file, skipping lines without '='"""
+    return {
+        key.strip(): value.strip()
+        for key, sep, value in (line.partition("=") for line in content.splitlines())
+        if sep
+    }
+
+
 # =============================================================================
 # Sub-Components - New modular structure
 # =============================================================================
@@ -224,7 +252,7 @@ class Context:
         self.paths = PathConfig(self.root_dir, self.chromium_src)
         self.build = BuildConfig(self.architecture, self.build_type)
         self.artifact_registry = ArtifactRegistry()  # New artifact system
-        self.env = EnvConfig()
+        self.env = _SHARED_ENV
 
         # Set default gn_flags_file if not provided
         if not self.paths.gn_flags_file:
@@ -303,13 +331,13 @@ class Context:
         Initialize context from config
         Replaces __post_init__ logic for better testability
 
+        Shared factory for the build resolver and the dev CLI.
+
         Note: root_dir is always computed from package location, never from config.
         """
-        chromium_src = (
-            Path(config.get("chromium_src", ""))
-            if config.get("chromium_src")
-            else Path()
-        )
+        chromium_src = config.get("chromium_src") or Path()
+        if not isinstance(chromium_src, Path):
+            chromium_src = Path(chromium_src)
 
         # Get architecture or use platform default
         arch = config.get("architecture") or get_platform_arch()
@@ -323,21 +351,31 @@ class Context:
 
         return ctx
 
+    def for_architecture(self, architecture: str) -> "Context":
+        """Derive a context for another architecture from this one
+
+        Carries over the version info already loaded by this context, so
+        __post_init__ skips re-reading the version files. Artifacts and the
+        fixed app path are not carried over.
+        """
+        return replace(
+            self,
+            architecture=architecture,
+            artifacts={},
+            _fixed_app_path=None,
+        )
+
     @staticmethod
     def _load_chromium_version(root_dir: Path):
         """
         Load chromium version from CHROMIUM_VERSION file
         Returns: (version_string, version_dict)
         """
-        version_dict = {}
-        version_file = join_paths(root_dir, "CHROMIUM_VERSION")
-
-        if version_file.exists():
-            # Parse VERSION file format: MAJOR=137\nMINOR=0\nBUILD=7151\nPATCH=69
-            for line in version_file.read_text().strip().split("\n"):
-                key, value = line.split("=")
-                version_dict[key] = value
+        content = _read_version_file(join_paths(root_dir, "CHROMIUM_VERSION"))
+        # Parse VERSION file format: MAJOR=137\nMINOR=0\nBUILD=7151\nPATCH=69
+        version_dict = _parse_version_values(content)
 
+        if content:
             # Construct chromium_version as MAJOR.MINOR.BUILD.PATCH
             chromium_version = f"{version_dict['MAJOR']}.{version_dict['MINOR']}.{version_dict['BUILD']}.{version_dict['PATCH']}"
             return chromium_version, version_dict
@@ -347,10 +385,9 @@ class Context:
     @staticmethod
     def _load_browseros_build_offset(root_dir: Path) -> str:
         """Load browseros build offset from config/BROWSEROS_BUILD_OFFSET"""
-        version_file = join_paths(root_dir, "build", "config", "BROWSEROS_BUILD_OFFSET")
-        if version_file.exists():
-            return version_file.read_text().strip()
-        return ""
+        return _read_version_file(
+            join_paths(root_dir, "build", "config", "BROWSEROS_BUILD_OFFSET")
+        )
 
     @staticmethod
     def _load_semantic_version(root_dir: Path) -> str:
@@ -364,17 +401,13 @@ class Context:
 
         Returns: "0.31.0" (PATCH only included if non-zero)
         """
-        version_file = join_paths(root_dir, "resources", "BROWSEROS_VERSION")
-        if not version_file.exists():
+        content = _read_version_file(
+            join_paths(root_dir, "resources", "BROWSEROS_VERSION")
+        )
+        if not content:
             return ""
 
-        version_dict = {}
-        for line in version_file.read_text().strip().split("\n"):
-            line = line.strip()
-            if not line or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            version_dict[key.strip()] = value.strip()
+        version_dict = _parse_version_values(content)
 
         major = version_dict.get("BROWSEROS_MAJOR", "0")
         minor = version_dict.get("BROWSEROS_MINOR", "0")
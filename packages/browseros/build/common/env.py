@@ -10,7 +10,7 @@ The module automatically loads .env files from the project root on import.
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
@@ -52,6 +52,10 @@ class EnvConfig:
             chromium_path = Path(env.chromium_src)
     """
 
+    # Every property reads os.environ live, so instances hold no state and
+    # can be shared freely (see Context.env)
+    __slots__ = ()
+
     # === Build Configuration ===
 
     @property
@@ -227,18 +231,25 @@ class EnvConfig:
             env = EnvConfig()
             env.validate_required("chromium_src", "macos_certificate_name")
         """
-        missing = []
-        for var_name in var_names:
-            # Convert property name to env var name (e.g., chromium_src -> CHROMIUM_SRC)
-            env_var = var_name.upper()
-            if not os.environ.get(env_var):
-                missing.append(env_var)
+        # Convert property names to env var names (e.g., chromium_src -> CHROMIUM_SRC)
+        missing = self.missing_vars(*(var_name.upper() for var_name in var_names))
 
         if missing:
             raise ValueError(
                 f"Missing required environment variables: {', '.join(missing)}"
             )
 
+    @staticmethod
+    def missing_vars(*env_vars: str) -> List[str]:
+        """
+        Return the names in env_vars that are unset or empty, in order
+
+        Example:
+            missing = EnvConfig.missing_vars("ESIGNER_USERNAME", "ESIGNER_PASSWORD")
+        """
+        environ = os.environ
+        return [name for name in env_vars if not environ.get(name)]
+
     def get_r2_config(self) -> dict:
         """
         Get all R2 configuration as a dict
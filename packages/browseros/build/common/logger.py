@@ -4,13 +4,21 @@ Logging utilities for the build system
 Provides consistent logging with Typer output and file logging
 """
 
+import atexit
+import sys
+import time
 import typer
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
 # Global log file handle
 _log_file = None
 
+# Last formatted timestamp, reused for every line logged within that second
+_stamp_second = None
+_stamp = ""
+
 
 def _ensure_log_file():
     """Ensure log file is created with timestamp"""
@@ -31,54 +39,115 @@ def _ensure_log_file():
             f"BrowserOS Build Log - Started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
         )
         _log_file.write("=" * 80 + "\n\n")
+        atexit.register(close_log_file)
     return _log_file
 
 
-def _log_to_file(message: str):
-    """Write message to log file with timestamp"""
+def _timestamp() -> str:
+    """Current local time as YYYY-MM-DD HH:MM:SS, formatted once per second
+
+    Each new second also flushes what was logged during the previous one
+    (stdout and the log file), so at most about a second of output is held
+    back or lost if the process is killed.
+    """
+    global _stamp_second, _stamp
+    now = int(time.time())
+    if now != _stamp_second:
+        _stamp_second = now
+        _stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        flush_logs()
+    return _stamp
+
+
+def _log_to_file(message: str, flush: bool = False):
+    """Write message to log file with timestamp
+
+    Writes are buffered (run_command logs every line of compiler output);
+    warnings and errors flush immediately, the rest is flushed once per
+    second, by flush_logs() at module boundaries, and on exit. Nothing is
+    written after close_log_file().
+    """
     log_file = _ensure_log_file()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_file.write(f"[{timestamp}] {message}\n")
-    log_file.flush()
+    if log_file.closed:
+        return
+    log_file.write(f"[{_timestamp()}] {message}\n")
+    if flush:
+        log_file.flush()
+
+
+def flush_logs():
+    """Flush buffered stdout and log file output
+
+    Called at module boundaries, before spawning subprocesses and once per
+    second from _timestamp(), so piped output (CI) keeps streaming and a
+    killed build loses at most about a second of it.
+    """
+    sys.stdout.flush()
+    if _log_file is not None and not _log_file.closed:
+        _log_file.flush()
+
+
+@lru_cache(maxsize=4)
+def _is_terminal(stream) -> bool:
+    return stream.isatty()
+
+
+def _echo(message: str, **styles):
+    """Print a line to stdout
+
+    On a terminal this is typer.secho (colored, shown at once). When stdout
+    is piped, as in CI, ANSI styles would be stripped anyway, so the line goes
+    into the stream's buffer without typer's per-call flush; see flush_logs()
+    for when the buffer is written out.
+    """
+    stream = sys.stdout
+    if _is_terminal(stream):
+        typer.secho(message, **styles)
+    else:
+        stream.write(f"{message}\n")
 
 
 def log_info(message: str):
     """Print info message using Typer"""
-    typer.echo(message)
+    _echo(message)
     _log_to_file(f"INFO: {message}")
 
 
 def log_warning(message: str):
     """Print warning message with color"""
-    typer.secho(f"⚠️  {message}", fg=typer.colors.YELLOW)
-    _log_to_file(f"WARNING: {message}")
+    _echo(f"⚠️  {message}", fg=typer.colors.YELLOW)
+    _log_to_file(f"WARNING: {message}", flush=True)
 
 
 def log_error(message: str):
     """Print error message to stderr with color"""
+    # Keep buffered stdout lines ahead of the error when both go to one log
+    sys.stdout.flush()
     typer.secho(f"❌ {message}", fg=typer.colors.RED, err=True)
-    _log_to_file(f"ERROR: {message}")
+    _log_to_file(f"ERROR: {message}", flush=True)
 
 
 def log_success(message: str):
     """Print success message with color"""
-    typer.secho(f"✅ {message}", fg=typer.colors.GREEN)
+    _echo(f"✅ {message}", fg=typer.colors.GREEN)
     _log_to_file(f"SUCCESS: {message}")
 
 
 def log_debug(message: str, enabled: bool = False):
     """Print debug message if enabled"""
     if enabled:
-        typer.secho(f"🔍 {message}", fg=typer.colors.BLUE, dim=True)
+        _echo(f"🔍 {message}", fg=typer.colors.BLUE, dim=True)
         _log_to_file(f"DEBUG: {message}")
 
 
 def close_log_file():
-    """Close the log file if it's open"""
-    global _log_file
-    if _log_file:
+    """Close the log file if it's open
+
+    The closed handle is kept, so a later log call does not start a second
+    build log.
+    """
+    if _log_file is not None:
         _log_file.close()
-        _log_file = None
 
 
 # Export all logging functions
@@ -88,6 +157,7 @@ __all__ = [
     'log_error',
     'log_success',
     'log_debug',
+    'flush_logs',
     'close_log_file',
     '_log_to_file',  # Internal use by utils.run_command
 ]
\ No newline at end of file
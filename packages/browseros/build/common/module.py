@@ -6,7 +6,9 @@ This module defines the base class for all build modules and the validation fram
 All build modules should inherit from BuildModule and implement validate() and execute().
 """
 
-from typing import List
+from collections.abc import Mapping
+from importlib import import_module
+from typing import Dict, FrozenSet, Type
 
 
 class ValidationError(Exception):
@@ -28,9 +30,13 @@ class CommandModule:
     Modules are self-contained and declare their requirements and outputs explicitly.
 
     Class Attributes:
-        produces: List of artifact names this module creates (e.g., ["signed_app", "notarization_zip"])
-        requires: List of artifact names this module needs (e.g., ["built_app"])
+        produces: Artifact names this module creates (e.g., frozenset({"signed_app", "notarization_zip"}))
+        requires: Artifact names this module needs (e.g., frozenset({"built_app"}))
         description: Human-readable description for --list output
+        parallel_safe: True if the module touches no state shared with its
+            neighbours, so adjacent parallel_safe modules may run concurrently
+        supported_platforms: get_platform() values the module runs on (empty
+            means all); checked by the pipeline before validate()
 
     Methods:
         validate(context): Check if module can run, raise ValidationError if not
@@ -38,8 +44,8 @@ class CommandModule:
 
     Example:
         class CleanModule(BuildModule):
-            produces = []
-            requires = []
+            produces = frozenset()
+            requires = frozenset()
             description = "Clean build artifacts and reset git state"
 
             def validate(self, context):
@@ -53,9 +59,13 @@ class CommandModule:
     """
 
     # Metadata as class attributes (override in subclasses)
-    produces: List[str] = []
-    requires: List[str] = []
+    # frozensets: immutable, so the shared class-level defaults can't be
+    # mutated through one subclass, and cheap to test for membership
+    produces: FrozenSet[str] = frozenset()
+    requires: FrozenSet[str] = frozenset()
     description: str = "No description provided"
+    parallel_safe: bool = False
+    supported_platforms: FrozenSet[str] = frozenset()
 
     def validate(self, context) -> None:
         """
@@ -103,3 +113,40 @@ class CommandModule:
         raise NotImplementedError(
             f"{self.__class__.__name__} must implement execute()"
         )
+
+
+class LazyModuleRegistry(Mapping):
+    """
+    Module name -> class mapping that imports each class on first lookup
+
+    Entries are "module.path:ClassName" strings, resolved relative to
+    `package`, so listing or validating names never imports anything and a
+    run only pays for the modules it actually uses.
+
+    Example:
+        AVAILABLE_MODULES = LazyModuleRegistry(
+            {"clean": "..modules.setup.clean:CleanModule"}, __package__
+        )
+    """
+
+    def __init__(self, entries: Dict[str, str], package: str):
+        self._entries = entries
+        self._package = package
+        self._classes: Dict[str, Type[CommandModule]] = {}
+
+    def __getitem__(self, name: str) -> Type[CommandModule]:
+        module_class = self._classes.get(name)
+        if module_class is None:
+            module_path, class_name = self._entries[name].split(":")
+            module = import_module(module_path, self._package)
+            module_class = self._classes[name] = getattr(module, class_name)
+        return module_class
+
+    def __contains__(self, name) -> bool:
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
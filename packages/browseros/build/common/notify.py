@@ -2,6 +2,7 @@
 """Notification system for BrowserOS build pipeline"""
 
 import os
+import queue
 import threading
 from typing import Optional, Dict, Any
 
@@ -10,6 +11,13 @@ COLOR_BLUE = "#2196F3"
 COLOR_GREEN = "#4CAF50"
 COLOR_RED = "#F44336"
 
+# Footer icon per build OS (see set_build_context)
+OS_ICONS = {
+    "macOS": "🍎",
+    "Windows": "🪟",
+    "Linux": "🐧",
+}
+
 # Build context (set once at pipeline start)
 _build_context: Dict[str, str] = {}
 
@@ -40,30 +48,54 @@ class Notifier:
     def __init__(self):
         self.slack_webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
         self.enabled = bool(self.slack_webhook_url)
+        self._session = None
+        self._queue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+        # Import requests once, and only when notifications are on; without
+        # it there is nothing to send, so don't start threads for it
+        if self.enabled:
+            try:
+                import requests
+            except ImportError:
+                self.enabled = False
+            else:
+                # One session keeps the webhook connection alive between posts
+                self._session = requests.Session()
 
     def notify(self, event: str, message: str, details: Optional[Dict[str, Any]] = None, color: str = "#36a64f") -> None:
-        """Send notification asynchronously (fire-and-forget)"""
+        """Send notification asynchronously (fire-and-forget)
+
+        The notify_* helpers check `enabled` themselves before formatting
+        their message, so a build without a webhook builds no payloads.
+        """
         if not self.enabled:
             return
 
-        # Fire and forget - run in background thread
-        thread = threading.Thread(
-            target=self._send_notification,
-            args=(event, message, details, color),
-            daemon=True
-        )
-        thread.start()
+        # Fire and forget - queue for the background sender thread
+        self._queue.put((event, message, details, color))
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._send_loop, daemon=True
+                    )
+                    self._worker.start()
+
+    def _send_loop(self) -> None:
+        """Send queued notifications in order (runs in background thread)"""
+        while True:
+            self._send_notification(*self._queue.get())
 
     def _send_notification(self, event: str, message: str, details: Optional[Dict[str, Any]], color: str) -> None:
         """Internal method to send notification (runs in background thread)"""
         try:
-            import requests
-
             # Build footer text
-            footer = f"🍎 {_get_context_footer()}" if _build_context.get("os") == "macOS" \
-                else f"🪟 {_get_context_footer()}" if _build_context.get("os") == "Windows" \
-                else f"🐧 {_get_context_footer()}" if _build_context.get("os") == "Linux" \
-                else _get_context_footer()
+            footer = _get_context_footer()
+            icon = OS_ICONS.get(_build_context.get("os"))
+            if icon:
+                footer = f"{icon} {footer}"
 
             # Use legacy attachment format for colored sidebar
             attachment = {
@@ -81,14 +113,12 @@ class Notifier:
 
             payload = {"attachments": [attachment]}
 
-            requests.post(
+            self._session.post(
                 self.slack_webhook_url,
                 json=payload,
                 timeout=5  # Quick timeout for fire-and-forget
             )
 
-        except ImportError:
-            pass
         except Exception:
             pass
 
@@ -108,6 +138,8 @@ def get_notifier() -> Notifier:
 def notify_pipeline_start(pipeline_name: str, modules: list) -> None:
     """Notify that pipeline has started"""
     notifier = get_notifier()
+    if not notifier.enabled:
+        return
     notifier.notify(
         "🚀 Pipeline Started",
         "Build pipeline started",
@@ -119,6 +151,8 @@ def notify_pipeline_start(pipeline_name: str, modules: list) -> None:
 def notify_pipeline_end(pipeline_name: str, duration: float) -> None:
     """Notify that pipeline completed successfully"""
     notifier = get_notifier()
+    if not notifier.enabled:
+        return
     mins = int(duration / 60)
     secs = int(duration % 60)
     notifier.notify(
@@ -132,6 +166,8 @@ def notify_pipeline_end(pipeline_name: str, duration: float) -> None:
 def notify_pipeline_error(pipeline_name: str, error: str) -> None:
     """Notify that pipeline failed with error"""
     notifier = get_notifier()
+    if not notifier.enabled:
+        return
     notifier.notify(
         "❌ Pipeline Failed",
         "Build pipeline failed",
@@ -143,6 +179,8 @@ def notify_pipeline_error(pipeline_name: str, error: str) -> None:
 def notify_module_start(module_name: str) -> None:
     """Notify that a module started executing"""
     notifier = get_notifier()
+    if not notifier.enabled:
+        return
     prefix = _get_context_prefix()
     notifier.notify(
         "▶️ Module Started",
@@ -155,6 +193,8 @@ def notify_module_start(module_name: str) -> None:
 def notify_module_completion(module_name: str, duration: float) -> None:
     """Notify that a module completed successfully"""
     notifier = get_notifier()
+    if not notifier.enabled:
+        return
     prefix = _get_context_prefix()
     notifier.notify(
         "✅ Module Completed",
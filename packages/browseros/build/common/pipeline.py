@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 """Pipeline validation for BrowserOS build system"""
 
-from typing import Dict, List, Type
+from collections import defaultdict
+from typing import List, Mapping, Type
 from .module import CommandModule
 from .utils import log_error, log_info
 
+# --list sections, in display order
+MODULE_GROUPS = {
+    "Setup & Environment": ["clean", "git_setup", "sparkle_setup", "configure"],
+    "Patches & Resources": ["patches", "chromium_replace", "string_replaces", "resources"],
+    "Build": ["compile"],
+    "Code Signing": ["sign_macos", "sign_windows", "sign_linux"],
+    "Packaging": ["package_macos", "package_windows", "package_linux"],
+    "Upload": ["upload"],
+}
+# Module name -> its --list section
+MODULE_GROUP_OF = {m: group for group, names in MODULE_GROUPS.items() for m in names}
 
-def validate_pipeline(pipeline: List[str], available_modules: Dict[str, Type[CommandModule]]) -> None:
+
+def validate_pipeline(pipeline: List[str], available_modules: Mapping[str, Type[CommandModule]]) -> None:
     """Validate that all modules in pipeline exist in available_modules
     
     Raises SystemExit if validation fails
@@ -30,45 +43,40 @@ def validate_pipeline(pipeline: List[str], available_modules: Dict[str, Type[Com
         raise SystemExit(1)
 
 
-def show_available_modules(available_modules: Dict[str, Type[CommandModule]]) -> None:
+def show_available_modules(available_modules: Mapping[str, Type[CommandModule]]) -> None:
     """Display all available modules with descriptions, grouped by category"""
 
-    # Group modules by prefix
-    groups = {
-        "Setup & Environment": ["clean", "git_setup", "sparkle_setup", "configure"],
-        "Patches & Resources": ["patches", "chromium_replace", "string_replaces", "resources"],
-        "Build": ["compile"],
-        "Code Signing": ["sign_macos", "sign_windows", "sign_linux"],
-        "Packaging": ["package_macos", "package_windows", "package_linux"],
-        "Upload": ["upload"],
-    }
-
     log_info("\n" + "=" * 70)
     log_info("Available Build Modules")
     log_info("=" * 70)
 
-    for group_name, module_names in groups.items():
+    # One pass over the registry sorts every module into its section
+    grouped = defaultdict(list)
+    ungrouped = []
+    for module_name, module_class in available_modules.items():
+        group_name = MODULE_GROUP_OF.get(module_name)
+        if group_name is None:
+            ungrouped.append((module_name, module_class))
+        else:
+            grouped[group_name].append((module_name, module_class))
+
+    for group_name in MODULE_GROUPS:
         # Only show group if it has modules
-        group_modules = [m for m in module_names if m in available_modules]
+        group_modules = grouped.get(group_name)
         if not group_modules:
             continue
 
         log_info(f"\n{group_name}:")
         log_info("-" * 70)
 
-        for module_name in group_modules:
-            module_class = available_modules[module_name]
+        for module_name, module_class in group_modules:
             log_info(f"  {module_name:20} {module_class.description}")
 
     # Show any modules not in groups (for extensibility)
-    all_grouped = set(m for group in groups.values() for m in group)
-    ungrouped = sorted(set(available_modules.keys()) - all_grouped)
-
     if ungrouped:
         log_info("\nOther:")
         log_info("-" * 70)
-        for module_name in ungrouped:
-            module_class = available_modules[module_name]
+        for module_name, module_class in sorted(ungrouped):
             log_info(f"  {module_name:20} {module_class.description}")
 
     log_info("\n" + "=" * 70)
@@ -19,6 +19,8 @@ Precedence (DIRECT mode):
 This centralizes ALL configuration resolution in one place.
 """
 
+from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Tuple
 
@@ -26,6 +28,49 @@ from .context import Context
 from .env import EnvConfig
 from .utils import get_platform_arch, log_info
 
+class Phase(StrEnum):
+    """Build pipeline phases, in execution order
+
+    Values are the DIRECT mode phase flag names, so a Phase can be used
+    directly as a cli_args key.
+    """
+
+    SETUP = "setup"
+    PREP = "prep"
+    BUILD = "build"
+    SIGN = "sign"
+    PACKAGE = "package"
+    UPLOAD = "upload"
+
+
+# Phase flags accepted in DIRECT mode, in execution order
+PHASE_FLAGS = tuple(Phase)
+
+
+@lru_cache(maxsize=8)
+def validate_chromium_src(chromium_src: str, mode: str) -> Path:
+    """Convert chromium_src to a Path and check that it exists.
+
+    Cached per (path, mode) so repeated resolution in one process stats once.
+
+    Args:
+        chromium_src: Raw path string from CLI, env, or YAML
+        mode: Label used in the error message (e.g., "CONFIG MODE")
+
+    Returns:
+        Validated chromium_src Path
+
+    Raises:
+        ValueError: If the directory does not exist
+    """
+    path = Path(chromium_src)
+    if not path.exists():
+        raise ValueError(
+            f"{mode}: chromium_src does not exist: {path}\n"
+            f"Expected directory with Chromium source code"
+        )
+    return path
+
 
 def resolve_config(
     cli_args: Dict[str, Any],
@@ -84,16 +129,9 @@ def _resolve_config_mode(
             "    chromium_src: /path/to/chromium"
         )
 
-    chromium_src = Path(chromium_src_str)
+    chromium_src = validate_chromium_src(str(chromium_src_str), "CONFIG MODE")
     chromium_src_source = "cli" if cli_args.get("chromium_src") else "yaml"
 
-    # Validate chromium_src exists
-    if not chromium_src.exists():
-        raise ValueError(
-            f"CONFIG MODE: chromium_src does not exist: {chromium_src}\n"
-            f"Expected directory with Chromium source code"
-        )
-
     # architecture: CLI override > YAML > platform default
     architecture = (
         cli_args.get("arch")
@@ -114,10 +152,12 @@ def _resolve_config_mode(
     log_info(f"✓ CONFIG MODE: architecture={architecture} ({arch_source})")
     log_info(f"✓ CONFIG MODE: build_type={build_type} ({build_type_source})")
 
-    return Context(
-        chromium_src=chromium_src,
-        architecture=architecture,
-        build_type=build_type,
+    return Context.init_context(
+        {
+            "chromium_src": chromium_src,
+            "architecture": architecture,
+            "build_type": build_type,
+        }
     )
 
 
@@ -145,14 +185,7 @@ def _resolve_direct_mode(cli_args: Dict[str, Any]) -> Context:
             "  CHROMIUM_SRC environment variable"
         )
 
-    chromium_src = Path(chromium_src)
-
-    # Validate chromium_src exists
-    if not chromium_src.exists():
-        raise ValueError(
-            f"DIRECT MODE: chromium_src does not exist: {chromium_src}\n"
-            f"Expected directory with Chromium source code"
-        )
+    chromium_src = validate_chromium_src(str(chromium_src), "DIRECT MODE")
 
     # architecture: CLI > Env > Platform default
     architecture = cli_args.get("arch") or env.arch
@@ -167,17 +200,19 @@ def _resolve_direct_mode(cli_args: Dict[str, Any]) -> Context:
     log_info(f"✓ DIRECT MODE: architecture={architecture} (cli/env/default)")
     log_info(f"✓ DIRECT MODE: build_type={build_type} (cli/default)")
 
-    return Context(
-        chromium_src=chromium_src,
-        architecture=architecture,
-        build_type=build_type,
+    return Context.init_context(
+        {
+            "chromium_src": chromium_src,
+            "architecture": architecture,
+            "build_type": build_type,
+        }
     )
 
 
 def resolve_pipeline(
     cli_args: Dict[str, Any],
     yaml_config: Optional[Dict[str, Any]] = None,
-    execution_order: Optional[List[Tuple[str, List[str]]]] = None,
+    execution_order: Optional[List[Tuple[Phase, List[str]]]] = None,
 ) -> List[str]:
     """Resolve build pipeline - single entry point.
 
@@ -228,7 +263,7 @@ def _resolve_pipeline_config_mode(yaml_config: Dict[str, Any]) -> List[str]:
 
 def _resolve_pipeline_direct_mode(
     cli_args: Dict[str, Any],
-    execution_order: Optional[List[Tuple[str, List[str]]]],
+    execution_order: Optional[List[Tuple[Phase, List[str]]]],
 ) -> List[str]:
     """DIRECT MODE: Pipeline from --modules or phase flags.
 
@@ -286,13 +321,12 @@ def _has_phase_flags(cli_args: Dict[str, Any]) -> bool:
     Returns:
         True if any phase flag is True
     """
-    phase_flags = ["setup", "prep", "build", "sign", "package", "upload"]
-    return any(cli_args.get(flag, False) for flag in phase_flags)
+    return any(cli_args.get(flag, False) for flag in PHASE_FLAGS)
 
 
 def _build_pipeline_from_flags(
     cli_args: Dict[str, Any],
-    execution_order: List[Tuple[str, List[str]]],
+    execution_order: List[Tuple[Phase, List[str]]],
 ) -> List[str]:
     """Build pipeline from phase flags with fixed execution order.
 
@@ -303,18 +337,9 @@ def _build_pipeline_from_flags(
     Returns:
         Module list in predetermined order
     """
-    enabled_phases = {
-        "setup": cli_args.get("setup", False),
-        "prep": cli_args.get("prep", False),
-        "build": cli_args.get("build", False),
-        "sign": cli_args.get("sign", False),
-        "package": cli_args.get("package", False),
-        "upload": cli_args.get("upload", False),
-    }
-
-    pipeline = []
-    for phase_name, phase_modules in execution_order:
-        if enabled_phases.get(phase_name, False):
-            pipeline.extend(phase_modules)
-
-    return pipeline
+    return [
+        module
+        for phase_name, phase_modules in execution_order
+        if cli_args.get(phase_name, False)
+        for module in phase_modules
+    ]
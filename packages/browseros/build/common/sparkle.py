@@ -6,16 +6,20 @@ Uses Python cryptography library - works on macOS, Windows, and Linux.
 """
 
 import base64
+import mmap
 from pathlib import Path
-from typing import Optional, Tuple
-
-from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from .env import EnvConfig
 from .utils import log_error
 
+# cryptography is only imported when a key is actually parsed; the CLI entry
+# point imports this module for every command, keeping startup fast
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
 
-def _parse_sparkle_private_key(key_data: str) -> Optional[Ed25519PrivateKey]:
+def _parse_sparkle_private_key(key_data: str) -> Optional["Ed25519PrivateKey"]:
     """Parse Sparkle Ed25519 private key from various formats
 
     Sparkle key formats:
@@ -27,6 +31,10 @@ def _parse_sparkle_private_key(key_data: str) -> Optional[Ed25519PrivateKey]:
         Ed25519PrivateKey or None on failure
     """
     try:
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PrivateKey,
+        )
+
         # Try base64 decode first (env var might be base64 encoded)
         try:
             key_bytes = base64.b64decode(key_data)
@@ -79,10 +87,16 @@ def sparkle_sign_file(
         return None, 0
 
     try:
-        file_data = file_path.read_bytes()
-        file_length = len(file_data)
+        # Ed25519 signs the whole message at once; map the file instead of
+        # reading a multi-hundred-MB DMG or zip into a bytes object
+        with open(file_path, "rb") as f:
+            file_length = f.seek(0, 2)
+            if file_length == 0:
+                signature_bytes = private_key.sign(b"")
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    signature_bytes = private_key.sign(data)
 
-        signature_bytes = private_key.sign(file_data)
         signature_b64 = base64.b64encode(signature_bytes).decode("ascii")
 
         return signature_b64, file_length
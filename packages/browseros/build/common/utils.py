@@ -6,10 +6,10 @@ Shared utilities for the build system
 import os
 import sys
 import subprocess
-import yaml
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Union
+from typing import Iterator, Optional, List, Dict, Union
 
 # Import logging functions from logger module - re-exported for other modules
 from .logger import (  # noqa: F401
@@ -17,6 +17,7 @@ from .logger import (  # noqa: F401
     log_error,
     log_warning,
     log_success,
+    flush_logs,
     _log_to_file,
 )
 
@@ -47,13 +48,17 @@ def run_command(
     cmd_str = " ".join(cmd)
     _log_to_file(f"RUN_COMMAND: 🔧 Running: {cmd_str}")
     log_info(f"🔧 Running: {cmd_str}")
+    # Write out buffered lines so they stay ahead of the command's output
+    flush_logs()
 
     try:
-        # Always use Popen for real-time streaming and capturing
+        # Always use Popen for real-time streaming and capturing. env=None
+        # inherits the parent environment as-is instead of re-encoding a
+        # copy of os.environ for every spawned command.
         process = subprocess.Popen(
             cmd,
             cwd=cwd,
-            env=env or os.environ,
+            env=env or None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,  # Merge stderr into stdout
             text=True,
@@ -62,12 +67,15 @@ def run_command(
         )
 
         stdout_lines = []
+        # One write per line instead of print()'s separate text and newline
+        # writes; a compile streams tens of thousands of lines through here
+        write = sys.stdout.write
 
         # Stream output line by line
         for line in iter(process.stdout.readline, ""):
             line = line.rstrip()
             if line:
-                print(line)  # Print to console in real-time
+                write(f"{line}\n")  # Print to console in real-time
                 _log_to_file(f"RUN_COMMAND: STDOUT: {line}")  # Log to file
                 stdout_lines.append(line)
 
@@ -121,28 +129,30 @@ def run_command(
         raise
 
 
-def load_config(config_path: Path) -> Dict:
-    """Load configuration from YAML file"""
-    if not config_path.exists():
-        log_error(f"Config file not found: {config_path}")
-        raise FileNotFoundError(f"Config file not found: {config_path}")
-
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
-
-    return config
+# Platform-specific utilities
+# sys.platform prefix -> consistent platform name
+PLATFORM_NAMES = {
+    "win32": "windows",
+    "darwin": "macos",
+    "linux": "linux",
+}
 
 
-# Platform-specific utilities
+@lru_cache(maxsize=1)
 def get_platform() -> str:
     """Get platform name in a consistent format"""
-    if IS_WINDOWS():
-        return "windows"
-    elif IS_MACOS():
-        return "macos"
-    elif IS_LINUX():
-        return "linux"
-    return "unknown"
+    key = "linux" if sys.platform.startswith("linux") else sys.platform
+    return PLATFORM_NAMES.get(key, "unknown")
+
+
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    """Locate an executable on PATH, caching the result per process
+
+    shutil.which() stats every PATH entry; the build's tools (git, dpkg-deb,
+    pkg-dmg) don't appear or move mid-run, so each is searched for once.
+    """
+    return shutil.which(name)
 
 
 def get_platform_arch() -> str:
@@ -159,9 +169,9 @@ def get_platform_arch() -> str:
         import platform
 
         machine = platform.machine()
-        if machine in ["x86_64", "AMD64"]:
+        if machine in ("x86_64", "AMD64"):
             return "x64"
-        elif machine in ["aarch64", "arm64"]:
+        elif machine in ("aarch64", "arm64"):
             return "arm64"
         else:
             # Default to x64 for unknown architectures
@@ -184,53 +194,209 @@ def get_app_extension() -> str:
 
 
 def normalize_path(path: Union[str, Path]) -> Path:
-    """Normalize path for current platform"""
-    path = Path(path)
-    if IS_WINDOWS():
-        # Convert forward slashes to backslashes on Windows
-        return Path(str(path).replace("/", "\\"))
-    return path
+    """Normalize path for current platform
+
+    pathlib already renders the native separator (WindowsPath turns forward
+    slashes into backslashes), so Path values are returned unchanged.
+    """
+    return path if isinstance(path, Path) else Path(path)
 
 
 def join_paths(*paths: Union[str, Path]) -> Path:
     """Join paths in a platform-aware way"""
-    if not paths:
-        return Path()
+    # One Path built from all segments, rather than one per "/" step
+    return Path(*paths)
+
+
+# Files at least this large retry through splice(2) if copy_file_range fails
+SPLICE_MIN_SIZE = 1 << 20
+SPLICE_CHUNK = 1 << 20
+# fast_copy runs once per file under copytree; probe for the syscall once
+HAS_COPY_FILE_RANGE = hasattr(os, "copy_file_range")
+
+
+def _splice_copy(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy size bytes between fds through a pipe with splice(2)
+
+    Data stays in the kernel. The pipe is widened to SPLICE_CHUNK so each
+    round trip moves 1 MiB rather than the 64 KiB default.
+    """
+    import fcntl
 
-    result = Path(paths[0])
-    for p in paths[1:]:
-        result = result / p
+    read_end, write_end = os.pipe2(os.O_CLOEXEC)
+    try:
+        try:
+            fcntl.fcntl(write_end, fcntl.F_SETPIPE_SZ, SPLICE_CHUNK)
+        except OSError:
+            pass  # Capped by /proc/sys/fs/pipe-max-size - keep the default
+
+        remaining = size
+        while remaining > 0:
+            in_pipe = os.splice(
+                src_fd,
+                write_end,
+                min(remaining, SPLICE_CHUNK),
+                flags=os.SPLICE_F_MOVE,
+            )
+            if in_pipe == 0:
+                raise OSError("splice made no progress")
+            remaining -= in_pipe
+            while in_pipe > 0:
+                written = os.splice(
+                    read_end, dst_fd, in_pipe, flags=os.SPLICE_F_MOVE
+                )
+                if written == 0:
+                    raise OSError("splice made no progress")
+                in_pipe -= written
+    finally:
+        os.close(read_end)
+        os.close(write_end)
+
+
+def fast_copy(src: Union[str, Path], dst: Union[str, Path]) -> str:
+    """Copy a file with metadata, like shutil.copy2, via copy_file_range(2)
+
+    On Linux the kernel copies the data directly (and reflinks on CoW
+    filesystems like btrfs/xfs). Where copy_file_range is refused (e.g.
+    some cross-filesystem copies), files of SPLICE_MIN_SIZE or more retry
+    through splice(2). Otherwise falls back to shutil.copy2 (which itself
+    uses sendfile on Linux). Usable as copytree's copy_function. Returns
+    the destination path.
+
+    Raises shutil.SameFileError when src and dst are the same path. A dst
+    hardlinked to src (see link_or_copy) is unlinked first, so the copy
+    never truncates src through the shared inode.
+    """
+    dst = os.path.join(dst, os.path.basename(src)) if os.path.isdir(dst) else dst
+
+    try:
+        same_file = os.path.samefile(src, dst)
+    except OSError:
+        same_file = False  # dst does not exist yet
+    if same_file:
+        if os.path.realpath(src) == os.path.realpath(dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        os.unlink(dst)
+
+    if HAS_COPY_FILE_RANGE and not os.path.islink(src):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                size = os.fstat(src_fd).st_size
+                try:
+                    remaining = size
+                    while remaining > 0:
+                        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            raise OSError("copy_file_range made no progress")
+                        remaining -= copied
+                except OSError:
+                    if size < SPLICE_MIN_SIZE:
+                        raise
+                    # Restart from scratch in case a partial copy happened
+                    os.lseek(src_fd, 0, os.SEEK_SET)
+                    os.lseek(dst_fd, 0, os.SEEK_SET)
+                    os.ftruncate(dst_fd, 0)
+                    _splice_copy(src_fd, dst_fd, size)
+            shutil.copystat(src, dst)
+            return str(dst)
+        except OSError:
+            pass  # Unsupported filesystem or kernel - use the portable path
+
+    return shutil.copy2(src, dst)
+
+
+def link_or_copy(src: Union[str, Path], dst: Union[str, Path]) -> str:
+    """Hardlink src to dst, falling back to fast_copy()
+
+    Only for sources that nothing downstream modifies in place: the two
+    paths share one inode. Any existing dst is replaced. Falls back to a
+    copy across filesystems or where hardlinks are unsupported. Usable as
+    copytree's copy_function. Returns the destination path.
+
+    Raises shutil.SameFileError when src and dst are the same path; a dst
+    that is already a hardlink to src is left as it is.
+    """
+    dst = os.path.join(dst, os.path.basename(src)) if os.path.isdir(dst) else dst
+
+    try:
+        same_file = os.path.samestat(os.lstat(src), os.lstat(dst))
+    except OSError:
+        same_file = False  # dst does not exist yet
+    if same_file:
+        if os.path.realpath(src) == os.path.realpath(dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        return str(dst)
+
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(src, dst, follow_symlinks=False)
+        return str(dst)
+    except OSError:
+        return fast_copy(src, dst)
 
-    return normalize_path(result)
 
+def iter_files(root: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file under root, recursively
 
-def safe_rmtree(path: Union[str, Path]) -> None:
-    """Safely remove directory tree, handling Windows symlinks and junction points"""
+    A scandir walk, so file/dir checks use the cached dirent type instead
+    of a stat per entry as Path.rglob("*") + is_file() does. Symlinked
+    directories are not followed. Yields nothing if root does not exist.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def safe_rmtree(path: Union[str, Path]) -> bool:
+    """Safely remove directory tree, handling Windows symlinks and junction points
+
+    Returns True if something was removed, False if the path did not exist.
+    """
     path = Path(path)
 
+    if not IS_WINDOWS():
+        # rmtree already walks with os.scandir and reuses dirent types, so
+        # skip the up-front exists() stat and treat a missing tree as a no-op
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            return False
+        return True
+
     if not path.exists():
-        return
+        return False
 
-    if IS_WINDOWS():
-        # On Windows, use rmdir for junctions and symlinks
-        import stat
+    # On Windows, use rmdir for junctions and symlinks
+    import stat
 
-        def handle_remove_readonly(func, path, exc):
-            """Error handler for Windows readonly files"""
-            if os.path.exists(path):
-                os.chmod(path, stat.S_IWRITE)
-                func(path)
+    def handle_remove_readonly(func, path, exc):
+        """Error handler for Windows readonly files"""
+        if os.path.exists(path):
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
 
-        # Try to remove as a junction/symlink first
-        try:
-            if path.is_symlink() or (path.is_dir() and os.path.islink(str(path))):
-                path.unlink()
-                return
-        except Exception:
-            pass
-
-        # Fall back to rmtree with error handler
-        shutil.rmtree(path, onerror=handle_remove_readonly)
-    else:
-        # On Unix-like systems, regular rmtree works fine
-        shutil.rmtree(path)
+    # Try to remove as a junction/symlink first
+    try:
+        if path.is_symlink() or (path.is_dir() and os.path.islink(str(path))):
+            path.unlink()
+            return True
+    except Exception:
+        pass
+
+    # Fall back to rmtree with error handler
+    shutil.rmtree(path, onerror=handle_remove_readonly)
+    return True
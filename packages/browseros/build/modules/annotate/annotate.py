@@ -5,22 +5,20 @@ For each feature, checks which files have modifications and creates a commit
 with the feature name and description.
 """
 
-import yaml
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
 
 from ..apply.utils import run_git_command
+from ..feature.select import load_features_yaml
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_error, log_success, log_warning
+from ...common.utils import log_info, log_error, log_success, log_warning, find_executable
 
 
 def load_features(features_file: Path) -> Dict:
     """Load features from YAML file."""
     try:
-        with open(features_file, "r") as f:
-            data = yaml.safe_load(f)
-            return data.get("features", {})
+        return load_features_yaml(features_file, mutable=False).get("features", {})
     except Exception as e:
         log_error(f"Failed to load features file: {e}")
         return {}
@@ -189,15 +187,13 @@ def annotate_single_feature(
 class AnnotateModule(CommandModule):
     """Create git commits organized by features from features.yaml"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Create git commits organized by features"
 
     def validate(self, ctx: Context) -> None:
         """Validate git is available and chromium_src exists."""
-        import shutil
-
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
@@ -6,7 +6,7 @@ from typing import List, Tuple, Optional
 
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_error, log_warning, log_success
+from ...common.utils import log_info, log_error, log_warning, log_success, find_executable
 from .common import find_patch_files, process_patch_list
 
 
@@ -72,15 +72,13 @@ def apply_all_patches(
 class ApplyAllModule(CommandModule):
     """Apply all patches from chromium_patches/"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Apply all patches from chromium_patches/"
 
     def validate(self, ctx: Context) -> None:
         """Validate git is available"""
-        import shutil
-
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
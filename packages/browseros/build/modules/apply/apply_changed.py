@@ -12,8 +12,8 @@ from dataclasses import dataclass
 
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_error, log_success, log_warning
-from .common import apply_single_patch
+from ...common.utils import log_info, log_error, log_success, log_warning, find_executable
+from .common import apply_single_patch, apply_patches_parallel
 from .utils import (
     run_git_command,
     file_exists_in_commit,
@@ -43,7 +43,15 @@ class ChangeType(Enum):
     COPIED = "C"
 
 
-@dataclass
+# Confirmation prompt sections: (change type, heading, line marker)
+CONFIRMATION_SECTIONS = (
+    (ChangeType.ADDED, "Added", "+"),
+    (ChangeType.MODIFIED, "Modified", "~"),
+    (ChangeType.DELETED, "Deleted", "-"),
+)
+
+
+@dataclass(slots=True)
 class PatchChange:
     """Represents a changed patch file"""
     patch_path: str  # Path relative to browseros repo (e.g., chromium_patches/chrome/foo.cc)
@@ -157,26 +165,18 @@ def format_confirmation_prompt(patch_changes: List[PatchChange]) -> str:
     lines = []
     lines.append(f"\nFound {len(patch_changes)} changed patch(es):\n")
 
-    # Group by change type
-    added = [p for p in patch_changes if p.change_type == ChangeType.ADDED]
-    modified = [p for p in patch_changes if p.change_type == ChangeType.MODIFIED]
-    deleted = [p for p in patch_changes if p.change_type == ChangeType.DELETED]
-    other = [p for p in patch_changes if p.change_type not in (ChangeType.ADDED, ChangeType.MODIFIED, ChangeType.DELETED)]
+    # Group by change type in one pass; types without a section go to Other
+    groups = {change_type: [] for change_type, _, _ in CONFIRMATION_SECTIONS}
+    other = []
+    for p in patch_changes:
+        groups.get(p.change_type, other).append(p)
 
-    if added:
-        lines.append(f"  Added ({len(added)}):")
-        for p in added:
-            lines.append(f"    + {p.chromium_path}")
-
-    if modified:
-        lines.append(f"  Modified ({len(modified)}):")
-        for p in modified:
-            lines.append(f"    ~ {p.chromium_path}")
-
-    if deleted:
-        lines.append(f"  Deleted ({len(deleted)}):")
-        for p in deleted:
-            lines.append(f"    - {p.chromium_path}")
+    for change_type, label, marker in CONFIRMATION_SECTIONS:
+        group = groups[change_type]
+        if group:
+            lines.append(f"  {label} ({len(group)}):")
+            for p in group:
+                lines.append(f"    {marker} {p.chromium_path}")
 
     if other:
         lines.append(f"  Other ({len(other)}):")
@@ -203,6 +203,9 @@ def apply_changed_patches(
     Returns:
         Tuple of (applied_count, reset_only_count, failed_list)
     """
+    if dry_run:
+        return _check_changed_patches(ctx, patch_changes)
+
     applied = 0
     reset_only = 0
     failed = []
@@ -216,28 +219,24 @@ def apply_changed_patches(
 
         if change.change_type == ChangeType.DELETED:
             # Patch was deleted - just reset file to base (restore original)
-            if dry_run:
-                log_info(f"  Would reset (patch deleted): {chromium_path}")
-                reset_only += 1
+            log_info(f"  Resetting (patch deleted): {chromium_path}")
+            if file_exists_in_commit(chromium_path, reset_to, chromium_src):
+                if reset_file_to_commit(chromium_path, reset_to, chromium_src):
+                    log_success(f"    ✓ Restored to {reset_to[:8]}: {chromium_path}")
+                    reset_only += 1
+                else:
+                    log_error(f"    ✗ Failed to reset: {chromium_path}")
+                    failed.append(chromium_path)
             else:
-                log_info(f"  Resetting (patch deleted): {chromium_path}")
-                if file_exists_in_commit(chromium_path, reset_to, chromium_src):
-                    if reset_file_to_commit(chromium_path, reset_to, chromium_src):
-                        log_success(f"    ✓ Restored to {reset_to[:8]}: {chromium_path}")
-                        reset_only += 1
-                    else:
-                        log_error(f"    ✗ Failed to reset: {chromium_path}")
-                        failed.append(chromium_path)
+                # File doesn't exist in base - delete it
+                target_file = chromium_src / chromium_path
+                if target_file.exists():
+                    target_file.unlink()
+                    log_success(f"    ✓ Deleted (not in {reset_to[:8]}): {chromium_path}")
+                    reset_only += 1
                 else:
-                    # File doesn't exist in base - delete it
-                    target_file = chromium_src / chromium_path
-                    if target_file.exists():
-                        target_file.unlink()
-                        log_success(f"    ✓ Deleted (not in {reset_to[:8]}): {chromium_path}")
-                        reset_only += 1
-                    else:
-                        log_info(f"    Already absent: {chromium_path}")
-                        reset_only += 1
+                    log_info(f"    Already absent: {chromium_path}")
+                    reset_only += 1
         else:
             # Added or modified - reset and apply patch
             if not patch_path.exists():
@@ -261,18 +260,39 @@ def apply_changed_patches(
     return applied, reset_only, failed
 
 
+def _check_changed_patches(
+    ctx: Context, patch_changes: List[PatchChange]
+) -> Tuple[int, int, List[str]]:
+    """Dry run of apply_changed_patches.
+
+    Nothing is reset in a dry run, so instead of walking the changes one
+    file at a time, all patches are checked in one concurrent pass.
+    """
+    patches_dir = ctx.get_patches_dir()
+    reset_only = 0
+    to_check = []
+
+    for change in patch_changes:
+        if change.change_type == ChangeType.DELETED:
+            log_info(f"  Would reset (patch deleted): {change.chromium_path}")
+            reset_only += 1
+        else:
+            to_check.append((patches_dir / change.chromium_path, change.chromium_path))
+
+    applied, failed = apply_patches_parallel(to_check, ctx.chromium_src, dry_run=True)
+    return applied, reset_only, failed
+
+
 class ApplyChangedModule(CommandModule):
     """Apply patches that changed in specific commits"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Apply patches changed in specific commits"
 
     def validate(self, ctx: Context) -> None:
         """Validate git is available and repos exist"""
-        import shutil
-
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
@@ -351,13 +371,14 @@ class ApplyChangedModule(CommandModule):
         log_info(f"\nWill reset files to: {reset_to}")
 
         if dry_run:
+            # Nothing will change, so there is nothing to confirm
             log_info("\n[DRY RUN - No changes will be made]\n")
-
-        # Ask for confirmation
-        response = input("\nProceed? [y/N]: ").strip().lower()
-        if response not in ("y", "yes"):
-            log_warning("Aborted by user")
-            return
+        else:
+            # Ask for confirmation
+            response = input("\nProceed? [y/N]: ").strip().lower()
+            if response not in ("y", "yes"):
+                log_warning("Aborted by user")
+                return
 
         # Apply changes
         log_info("\nApplying changes...")
@@ -2,12 +2,11 @@
 Apply Feature - Apply patches for a specific feature.
 """
 
-import yaml
 from typing import List, Tuple, Optional
 
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_error, log_warning, log_success
+from ...common.utils import log_info, log_error, log_warning, log_success, find_executable
 from .common import process_patch_list
 
 
@@ -28,14 +27,15 @@ def apply_feature_patches(
     Returns:
         Tuple of (applied_count, failed_list)
     """
+    from ..feature.select import load_features_yaml
+
     # Load features.yaml
     features_path = build_ctx.get_features_yaml_path()
     if not features_path.exists():
         log_error("No features.yaml found")
         return 0, []
 
-    with open(features_path) as f:
-        data = yaml.safe_load(f)
+    data = load_features_yaml(features_path, mutable=False)
 
     features = data.get("features", {})
 
@@ -88,15 +88,13 @@ def apply_feature_patches(
 class ApplyFeatureModule(CommandModule):
     """Apply patches for a specific feature"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Apply patches for a specific feature"
 
     def validate(self, ctx: Context) -> None:
         """Validate git is available"""
-        import shutil
-
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
@@ -4,11 +4,22 @@ Common functions shared across apply module commands.
 Contains core patch application logic used by apply_all, apply_feature, and apply_patch.
 """
 
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from .utils import run_git_command, file_exists_in_commit, reset_file_to_commit
-from ...common.utils import log_info, log_error, log_success, log_warning
+from ...common.utils import log_info, log_error, log_success, log_warning, iter_files
+
+# Concurrent git apply processes; capped to avoid thrashing on large trees
+PATCH_APPLY_WORKERS = min(8, os.cpu_count() or 1)
+
+# Fingerprints of applied patches, kept inside .git so resets and
+# `git clean` leave it alone: {display_name: [patch_digest, file_digest]}
+APPLIED_PATCHES_STATE = "browseros_applied_patches.json"
 
 
 def find_patch_files(patches_dir: Path) -> List[Path]:
@@ -20,18 +31,12 @@ def find_patch_files(patches_dir: Path) -> List[Path]:
     Returns:
         List of patch file paths, sorted
     """
-    if not patches_dir.exists():
-        return []
-
     return sorted(
         [
-            p
-            for p in patches_dir.rglob("*")
-            if p.is_file()
-            and not p.name.endswith(".deleted")
-            and not p.name.endswith(".binary")
-            and not p.name.endswith(".rename")
-            and not p.name.startswith(".")
+            Path(entry.path)
+            for entry in iter_files(patches_dir)
+            if not entry.name.endswith((".deleted", ".binary", ".rename"))
+            and not entry.name.startswith(".")
         ]
     )
 
@@ -72,52 +77,168 @@ def apply_single_patch(
 
     if dry_run:
         # Just check if patch would apply
-        result = run_git_command(
-            ["git", "apply", "--check", "-p1", str(patch_path)], cwd=chromium_src
-        )
-        if result.returncode == 0:
-            log_success(f"  ✓ Would apply: {display_path}")
-            return True, None
-        else:
-            log_error(f"  ✗ Would fail: {display_path}")
-            return False, result.stderr
+        result = _git_apply(patch_path, chromium_src, check_only=True)
+        return _report_check(result, display_path)
+
+    # Try standard apply first, then fall back to a 3-way merge
+    result = _git_apply(patch_path, chromium_src)
+    if result.returncode != 0:
+        result = _git_apply(patch_path, chromium_src, three_way=True)
+    return _report_apply(result, display_path)
+
+
+def _git_apply(
+    patch_path: Path,
+    chromium_src: Path,
+    check_only: bool = False,
+    three_way: bool = False,
+):
+    """Run git apply for one patch file and return the CompletedProcess."""
+    if check_only:
+        cmd = ["git", "apply", "--check", "-p1", str(patch_path)]
     else:
-        # Try standard apply first
-        result = run_git_command(
-            [
-                "git",
-                "apply",
-                "--ignore-whitespace",
-                "--whitespace=nowarn",
-                "-p1",
-                str(patch_path),
-            ],
-            cwd=chromium_src,
-        )
+        cmd = ["git", "apply", "--ignore-whitespace", "--whitespace=nowarn", "-p1"]
+        if three_way:
+            cmd.append("--3way")
+        cmd.append(str(patch_path))
+    return run_git_command(cmd, cwd=chromium_src)
+
 
-        if result.returncode != 0:
-            # Try with 3-way merge
-            result = run_git_command(
-                [
-                    "git",
-                    "apply",
-                    "--ignore-whitespace",
-                    "--whitespace=nowarn",
-                    "-p1",
-                    "--3way",
-                    str(patch_path),
-                ],
-                cwd=chromium_src,
+def _report_check(result, display_path) -> Tuple[bool, Optional[str]]:
+    """Log and convert a git apply --check result."""
+    if result.returncode == 0:
+        log_success(f"  ✓ Would apply: {display_path}")
+        return True, None
+    log_error(f"  ✗ Would fail: {display_path}")
+    return False, result.stderr
+
+
+def _report_apply(result, display_path) -> Tuple[bool, Optional[str]]:
+    """Log and convert a git apply result."""
+    if result.returncode == 0:
+        log_success(f"  ✓ Applied: {display_path}")
+        return True, None
+    log_error(f"  ✗ Failed: {display_path}")
+    if result.stderr:
+        log_error(f"    {result.stderr}")
+    return False, result.stderr
+
+
+def _file_digest(path: Path) -> Optional[str]:
+    """BLAKE2b hex digest of a file's contents, or None if it doesn't exist."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "blake2b").hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def _load_applied_state(chromium_src: Path) -> Dict[str, List[str]]:
+    """Load applied-patch fingerprints for chromium_src ({} if none)."""
+    try:
+        with open(chromium_src / ".git" / APPLIED_PATCHES_STATE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_applied_state(chromium_src: Path, state: Dict[str, List[str]]) -> None:
+    """Persist applied-patch fingerprints; skipped if .git isn't a directory."""
+    git_dir = chromium_src / ".git"
+    if not git_dir.is_dir():
+        return
+    try:
+        with open(git_dir / APPLIED_PATCHES_STATE, "w") as f:
+            json.dump(state, f)
+    except OSError as e:
+        log_warning(f"Could not save applied patch state: {e}")
+
+
+def apply_patches_parallel(
+    patch_list: List[Tuple[Path, str]],
+    chromium_src: Path,
+    dry_run: bool = False,
+    max_workers: int = PATCH_APPLY_WORKERS,
+) -> Tuple[int, List[str]]:
+    """Apply independent per-file patches concurrently.
+
+    Plain `git apply` and `git apply --check` only touch the working tree, so
+    they run in a thread pool. Patches that fail the first pass are retried
+    one at a time with --3way, which writes the index and must not race.
+    Results are logged in patch_list order.
+
+    When applying, a patch is skipped if both it and its target file are
+    unchanged since it was last applied (see APPLIED_PATCHES_STATE).
+
+    Args:
+        patch_list: List of (patch_path, display_name) tuples
+        chromium_src: Chromium source directory
+        dry_run: Only check if patches would apply
+        max_workers: Number of concurrent git processes
+
+    Returns:
+        Tuple of (applied_count, failed_list)
+    """
+    applied = 0
+    failed = []
+    state = {} if dry_run else _load_applied_state(chromium_src)
+    patch_digests = {}
+
+    present = []
+    for patch_path, display_name in patch_list:
+        patch_digest = _file_digest(patch_path)
+        if patch_digest is None:
+            log_warning(f"  Patch not found: {display_name}")
+            failed.append(display_name)
+            continue
+
+        key = str(display_name)
+        if not dry_run:
+            recorded = state.get(key)
+            if (
+                recorded
+                and recorded[0] == patch_digest
+                and recorded[1] == _file_digest(chromium_src / key)
+            ):
+                log_success(f"  ✓ Already applied: {display_name}")
+                applied += 1
+                continue
+            patch_digests[key] = patch_digest
+
+        present.append((patch_path, display_name))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda item: _git_apply(item[0], chromium_src, check_only=dry_run),
+                present,
             )
+        )
+
+    for (patch_path, display_name), result in zip(present, results):
+        if dry_run:
+            success, _ = _report_check(result, display_name)
+        else:
+            if result.returncode != 0:
+                result = _git_apply(patch_path, chromium_src, three_way=True)
+            success, _ = _report_apply(result, display_name)
 
-        if result.returncode == 0:
-            log_success(f"  ✓ Applied: {display_path}")
-            return True, None
+            key = str(display_name)
+            file_digest = _file_digest(chromium_src / key) if success else None
+            if file_digest:
+                state[key] = [patch_digests[key], file_digest]
+            else:
+                state.pop(key, None)
+
+        if success:
+            applied += 1
         else:
-            log_error(f"  ✗ Failed: {display_path}")
-            if result.stderr:
-                log_error(f"    {result.stderr}")
-            return False, result.stderr
+            failed.append(display_name)
+
+    if not dry_run:
+        _save_applied_state(chromium_src, state)
+
+    return applied, failed
 
 
 def create_patch_commit(
@@ -175,7 +296,15 @@ def process_patch_list(
 
     Returns:
         Tuple of (applied_count, failed_list)
+
+    Note:
+        Without interactive prompts or per-file resets, patches are applied
+        concurrently via apply_patches_parallel(). Dry runs always take that
+        path, since they neither prompt nor reset files.
     """
+    if dry_run or (not interactive and not reset_to):
+        return apply_patches_parallel(patch_list, chromium_src, dry_run)
+
     applied = 0
     failed = []
     skipped = 0
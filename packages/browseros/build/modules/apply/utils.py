@@ -5,6 +5,7 @@ This module provides robust utilities for git operations, diff parsing,
 and patch management with comprehensive error handling.
 """
 
+import mmap
 import subprocess
 import click
 import re
@@ -15,6 +16,13 @@ from dataclasses import dataclass
 from ...common.context import Context
 from ...common.utils import log_error, log_success, log_warning
 
+# Header lines parse_diff_output() extracts fields from
+_DIFF_GIT_RE = re.compile(r"diff --git a/(.*) b/(.*)")
+_SIMILARITY_RE = re.compile(r"similarity index (\d+)%")
+# First characters of hunk lines (@@ headers, +/-/space content, "\ No
+# newline" markers, ---/+++ file lines), which are kept without inspection
+_DIFF_BODY_PREFIXES = ("+", "-", " ", "@", "\\")
+
 
 class FileOperation(Enum):
     """Types of file operations in a diff"""
@@ -27,7 +35,7 @@ class FileOperation(Enum):
     BINARY = "binary"
 
 
-@dataclass
+@dataclass(slots=True)
 class FilePatch:
     """Represents a single file's patch information"""
 
@@ -215,7 +223,7 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
                 )
 
             # Parse file paths from diff line
-            match = re.match(r"diff --git a/(.*) b/(.*)", line)
+            match = _DIFF_GIT_RE.match(line)
             if match:
                 _old_file = match.group(1)
                 new_file = match.group(2)
@@ -235,7 +243,10 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
 
         # Check for file metadata
         if current_file:
-            if line.startswith("deleted file"):
+            if line.startswith(_DIFF_BODY_PREFIXES):
+                # Hunk headers, content and markers - the bulk of every diff
+                current_patch_lines.append(line)
+            elif line.startswith("deleted file"):
                 current_operation = FileOperation.DELETE
                 current_patch_lines.append(line)
             elif line.startswith("new file"):
@@ -243,7 +254,7 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
                 current_patch_lines.append(line)
             elif line.startswith("similarity index"):
                 # Extract similarity percentage for renames
-                match = re.match(r"similarity index (\d+)%", line)
+                match = _SIMILARITY_RE.match(line)
                 if match:
                     similarity = int(match.group(1))
                 current_patch_lines.append(line)
@@ -269,23 +280,8 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
                     else current_operation
                 )
                 current_patch_lines.append(line)
-            elif (
-                line.startswith("index ")
-                or line.startswith("---")
-                or line.startswith("+++")
-            ):
-                current_patch_lines.append(line)
-            elif line.startswith("@@"):
-                # Hunk header
-                current_patch_lines.append(line)
-            elif line.startswith("+") or line.startswith("-") or line.startswith(" "):
-                # Actual diff content
-                current_patch_lines.append(line)
-            elif line.startswith("\\"):
-                # Special markers like "\ No newline at end of file"
-                current_patch_lines.append(line)
             else:
-                # Other content
+                # index lines and other content
                 current_patch_lines.append(line)
 
         i += 1
@@ -458,6 +454,34 @@ def apply_single_patch(
         return False, f"Failed: {patch_path.name} - {result.stderr}"
 
 
+def read_patch_preview(patch_path: Path, max_lines: int) -> Tuple[List[str], int]:
+    """Read the first max_lines lines of a patch and its total line count
+
+    The file is memory-mapped and scanned for newlines in place, so large
+    patches are never loaded into a single Python string.
+
+    Returns:
+        Tuple of (first lines, total line count)
+    """
+    with open(patch_path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return [""], 1
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = []
+            total = 1
+            start = 0
+            end = mm.find(b"\n")
+            while end != -1:
+                if len(lines) < max_lines:
+                    lines.append(mm[start:end].decode("utf-8", errors="replace"))
+                total += 1
+                start = end + 1
+                end = mm.find(b"\n", start)
+            if len(lines) < max_lines:
+                lines.append(mm[start:].decode("utf-8", errors="replace"))
+            return lines, total
+
+
 def handle_patch_conflict(
     patch_path: Path, chromium_src: Path, error_msg: str = ""
 ) -> Tuple[bool, str]:
@@ -499,14 +523,13 @@ def handle_patch_conflict(
         elif choice == "4":
             # Show patch content
             try:
-                content = patch_path.read_text()
-                lines = content.split("\n")
+                lines, total = read_patch_preview(patch_path, 50)
                 # Show first 50 lines
                 click.echo("\n--- Patch Content (first 50 lines) ---")
-                for line in lines[:50]:
+                for line in lines:
                     click.echo(line)
-                if len(lines) > 50:
-                    click.echo(f"... and {len(lines) - 50} more lines")
+                if total > 50:
+                    click.echo(f"... and {total - 50} more lines")
                 click.echo("--- End of Preview ---\n")
             except Exception as e:
                 click.echo(f"Failed to read patch: {e}")
@@ -17,8 +17,8 @@ from ...common.utils import (
 
 
 class CompileModule(CommandModule):
-    produces = ["built_app"]
-    requires = []
+    produces = frozenset({"built_app"})
+    requires = frozenset()
     description = "Build BrowserOS using autoninja"
 
     def validate(self, ctx: Context) -> None:
@@ -43,7 +43,7 @@ from pathlib import Path
 
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import log_info, log_success, log_warning, IS_MACOS
+from ...common.utils import log_info, log_success, log_warning
 
 # Architectures to build for universal binary
 UNIVERSAL_ARCHITECTURES = ["arm64", "x64"]
@@ -66,17 +66,15 @@ class UniversalBuildModule(CommandModule):
         - BrowserOS_{version}_universal_signed.dmg
     """
 
-    produces = ["dmg_arm64", "dmg_x64", "dmg_universal"]
-    requires = []
+    produces = frozenset({"dmg_arm64", "dmg_x64", "dmg_universal"})
+    requires = frozenset()
     description = (
         "Build, sign, package, and upload universal binary (arm64 + x64) for macOS"
     )
+    supported_platforms = frozenset({"macos"})
 
     def validate(self, ctx: Context) -> None:
         """Validate universal build can run"""
-        if not IS_MACOS():
-            raise ValidationError("Universal builds only supported on macOS")
-
         # Check universalizer script exists
         universalizer = ctx.root_dir / "build/modules/package/universalizer_patched.py"
         if not universalizer.exists():
@@ -110,6 +108,15 @@ class UniversalBuildModule(CommandModule):
         from ..package.macos import MacOSPackageModule
         from ..storage import UploadModule
 
+        # Modules keep no per-run state (everything lives on the context), so
+        # one instance of each serves arm64, x64 and the universal pass
+        resources = ResourcesModule()
+        configure = ConfigureModule()
+        compile_module = CompileModule()
+        sign = MacOSSignModule()
+        package = MacOSPackageModule()
+        upload = UploadModule()
+
         # Clean all build directories before starting
         self._clean_build_directories(ctx)
 
@@ -131,15 +138,15 @@ class UniversalBuildModule(CommandModule):
             # === BUILD PHASE ===
             # Copy resources (arch-specific binaries like browseros_server, codex)
             log_info(f"\n📦 Copying resources for {arch}...")
-            ResourcesModule().execute(arch_ctx)
+            resources.execute(arch_ctx)
 
             # Configure build (GN gen)
             log_info(f"\n🔧 Configuring {arch}...")
-            ConfigureModule().execute(arch_ctx)
+            configure.execute(arch_ctx)
 
             # Compile (ninja)
             log_info(f"\n🏗️  Compiling {arch}...")
-            CompileModule().execute(arch_ctx)
+            compile_module.execute(arch_ctx)
 
             # Get app path for this architecture
             app_path = arch_ctx.get_app_path()
@@ -152,18 +159,18 @@ class UniversalBuildModule(CommandModule):
 
             # === SIGN PHASE ===
             log_info(f"\n🔏 Signing {arch} build...")
-            MacOSSignModule().execute(arch_ctx)
+            sign.execute(arch_ctx)
             log_success(f"✅ {arch} signing complete")
 
             # === PACKAGE PHASE ===
             log_info(f"\n📦 Packaging {arch} build...")
-            MacOSPackageModule().execute(arch_ctx)
+            package.execute(arch_ctx)
             log_success(f"✅ {arch} packaging complete")
 
             # === UPLOAD PHASE ===
             log_info(f"\n☁️  Uploading {arch} artifacts...")
             try:
-                UploadModule().execute(arch_ctx)
+                upload.execute(arch_ctx)
                 log_success(f"✅ {arch} upload complete")
             except Exception as e:
                 log_warning(f"⚠️  {arch} upload failed (non-fatal): {e}")
@@ -191,18 +198,18 @@ class UniversalBuildModule(CommandModule):
 
         # Sign universal
         log_info("\n🔏 Signing universal build...")
-        MacOSSignModule().execute(universal_ctx)
+        sign.execute(universal_ctx)
         log_success("✅ Universal signing complete")
 
         # Package universal
         log_info("\n📦 Packaging universal build...")
-        MacOSPackageModule().execute(universal_ctx)
+        package.execute(universal_ctx)
         log_success("✅ Universal packaging complete")
 
         # Upload universal
         log_info("\n☁️  Uploading universal artifacts...")
         try:
-            UploadModule().execute(universal_ctx)
+            upload.execute(universal_ctx)
             log_success("✅ Universal upload complete")
         except Exception as e:
             log_warning(f"⚠️  Universal upload failed (non-fatal): {e}")
@@ -257,12 +264,7 @@ class UniversalBuildModule(CommandModule):
             New Context object with architecture set and fixed app path
             to prevent universal auto-detection
         """
-        ctx = Context(
-            root_dir=base_ctx.root_dir,
-            chromium_src=base_ctx.chromium_src,
-            architecture=arch,
-            build_type=base_ctx.build_type,
-        )
+        ctx = base_ctx.for_architecture(arch)
         # Set fixed app path to prevent universal auto-detection in get_app_path()
         # This is critical: after arm64 is built, get_app_path() would otherwise
         # try to detect the universal dir for x64 context
@@ -280,12 +282,7 @@ class UniversalBuildModule(CommandModule):
         Returns:
             New Context object configured for universal binary
         """
-        ctx = Context(
-            root_dir=base_ctx.root_dir,
-            chromium_src=base_ctx.chromium_src,
-            architecture="universal",
-            build_type=base_ctx.build_type,
-        )
+        ctx = base_ctx.for_architecture("universal")
         # Set fixed app path to the universal binary
         ctx._fixed_app_path = (
             ctx.chromium_src / "out/Default_universal" / ctx.BROWSEROS_APP_NAME
@@ -7,8 +7,6 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, NamedTuple
 
-import requests
-
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
 from ...common.utils import log_info, log_success, log_error
@@ -24,9 +22,10 @@ class ExtensionInfo(NamedTuple):
 class BundledExtensionsModule(CommandModule):
     """Download extensions from CDN manifest and create bundled_extensions.json"""
 
-    produces = ["bundled_extensions"]
-    requires = []
+    produces = frozenset({"bundled_extensions"})
+    requires = frozenset()
     description = "Download and bundle extensions from CDN update manifest"
+    parallel_safe = True  # Only writes chrome/browser/browseros/bundled_extensions
 
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src or not ctx.chromium_src.exists():
@@ -64,6 +63,8 @@ class BundledExtensionsModule(CommandModule):
         """Fetch XML manifest and parse extension information"""
         log_info(f"  Fetching manifest: {url}")
 
+        import requests
+
         try:
             response = requests.get(url, timeout=30)
             response.raise_for_status()
@@ -126,6 +127,8 @@ class BundledExtensionsModule(CommandModule):
 
         log_info(f"  Downloading {ext.id} v{ext.version}...")
 
+        import requests
+
         try:
             response = requests.get(ext.codebase, stream=True, timeout=60)
             response.raise_for_status()
@@ -7,7 +7,7 @@ from typing import List, Optional, Tuple
 
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_success, log_warning
+from ...common.utils import log_info, log_success, log_warning, find_executable
 from .utils import (
     GitError,
     validate_git_repository,
@@ -60,14 +60,13 @@ def extract_single_commit(
 
 class ExtractCommitModule(CommandModule):
     """Extract patches from a single commit"""
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Extract patches from a single commit"
 
     def validate(self, ctx: Context) -> None:
         """Validate git repository"""
-        import shutil
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not validate_git_repository(ctx.chromium_src):
             raise ValidationError(f"Not a git repository: {ctx.chromium_src}")
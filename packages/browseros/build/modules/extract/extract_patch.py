@@ -86,7 +86,7 @@ def extract_single_file_patch(
     if chromium_path not in file_patches:
         # The file might be in the patches under a different key
         if len(file_patches) == 1:
-            patch = list(file_patches.values())[0]
+            patch = next(iter(file_patches.values()))
         else:
             return False, f"Unexpected diff output for: {chromium_path}"
     else:
@@ -8,7 +8,7 @@ from typing import List, Optional, Tuple
 
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
-from ...common.utils import log_info, log_error, log_success, log_warning
+from ...common.utils import log_info, log_error, log_success, log_warning, find_executable
 from .utils import (
     FileOperation,
     FilePatch,
@@ -299,14 +299,13 @@ def extract_commits_individually(
 
 class ExtractRangeModule(CommandModule):
     """Extract patches from a range of commits"""
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Extract patches from a range of commits"
 
     def validate(self, ctx: Context) -> None:
         """Validate git repository"""
-        import shutil
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not validate_git_repository(ctx.chromium_src):
             raise ValidationError(f"Not a git repository: {ctx.chromium_src}")
@@ -15,6 +15,13 @@ from dataclasses import dataclass
 from ...common.context import Context
 from ...common.utils import log_error, log_success, log_warning
 
+# Header lines parse_diff_output() extracts fields from
+_DIFF_GIT_RE = re.compile(r"diff --git a/(.*) b/(.*)")
+_SIMILARITY_RE = re.compile(r"similarity index (\d+)%")
+# First characters of hunk lines (@@ headers, +/-/space content, "\ No
+# newline" markers, ---/+++ file lines), which are kept without inspection
+_DIFF_BODY_PREFIXES = ("+", "-", " ", "@", "\\")
+
 
 class FileOperation(Enum):
     """Types of file operations in a diff"""
@@ -27,7 +34,7 @@ class FileOperation(Enum):
     BINARY = "binary"
 
 
-@dataclass
+@dataclass(slots=True)
 class FilePatch:
     """Represents a single file's patch information"""
 
@@ -251,7 +258,7 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
                 )
 
             # Parse file paths from diff line
-            match = re.match(r"diff --git a/(.*) b/(.*)", line)
+            match = _DIFF_GIT_RE.match(line)
             if match:
                 _old_file = match.group(1)
                 new_file = match.group(2)
@@ -271,7 +278,10 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
 
         # Check for file metadata
         if current_file:
-            if line.startswith("deleted file"):
+            if line.startswith(_DIFF_BODY_PREFIXES):
+                # Hunk headers, content and markers - the bulk of every diff
+                current_patch_lines.append(line)
+            elif line.startswith("deleted file"):
                 current_operation = FileOperation.DELETE
                 current_patch_lines.append(line)
             elif line.startswith("new file"):
@@ -279,7 +289,7 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
                 current_patch_lines.append(line)
             elif line.startswith("similarity index"):
                 # Extract similarity percentage for renames
-                match = re.match(r"similarity index (\d+)%", line)
+                match = _SIMILARITY_RE.match(line)
                 if match:
                     similarity = int(match.group(1))
                 current_patch_lines.append(line)
@@ -305,23 +315,8 @@ def parse_diff_output(diff_output: str) -> Dict[str, FilePatch]:
                     else current_operation
                 )
                 current_patch_lines.append(line)
-            elif (
-                line.startswith("index ")
-                or line.startswith("---")
-                or line.startswith("+++")
-            ):
-                current_patch_lines.append(line)
-            elif line.startswith("@@"):
-                # Hunk header
-                current_patch_lines.append(line)
-            elif line.startswith("+") or line.startswith("-") or line.startswith(" "):
-                # Actual diff content
-                current_patch_lines.append(line)
-            elif line.startswith("\\"):
-                # Special markers like "\ No newline at end of file"
-                current_patch_lines.append(line)
             else:
-                # Other content
+                # index lines and other content
                 current_patch_lines.append(line)
 
         i += 1
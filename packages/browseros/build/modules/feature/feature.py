@@ -4,13 +4,13 @@ Feature module - Manage feature-to-file mappings
 Simple feature management with YAML persistence.
 """
 
-import yaml
 from typing import Dict, List, Optional, Tuple
 from ...common.context import Context
 from ...common.module import CommandModule, ValidationError
 from ..extract.utils import get_commit_changed_files
-from ...common.utils import log_info, log_error, log_success, log_warning
+from ...common.utils import log_info, log_error, log_success, log_warning, find_executable
 from .validation import validate_description, validate_feature_name, VALID_PREFIXES
+from .select import load_features_yaml, save_features_yaml
 
 
 def add_or_update_feature(
@@ -50,14 +50,9 @@ def add_or_update_feature(
         return False, f"No changed files found in commit {commit}"
 
     # Load existing features
-    features: Dict = {"version": "1.0", "features": {}}
-    if features_file.exists():
-        with open(features_file, "r") as f:
-            content = yaml.safe_load(f)
-            if content:
-                features = content
-                if "features" not in features:
-                    features["features"] = {}
+    features: Dict = load_features_yaml(features_file)
+    if "features" not in features:
+        features["features"] = {}
 
     existing_feature = features["features"].get(feature_name)
 
@@ -99,8 +94,7 @@ def add_or_update_feature(
         }
 
     # Save to file
-    with open(features_file, "w") as f:
-        yaml.safe_dump(features, f, sort_keys=False, default_flow_style=False)
+    save_features_yaml(features_file, features)
 
     total_files = len(features["features"][feature_name]["files"])
     if existing_feature:
@@ -130,11 +124,10 @@ def list_features(ctx: Context):
         log_warning("No features.yaml found")
         return
 
-    with open(features_file, "r") as f:
-        content = yaml.safe_load(f)
-        if not content or "features" not in content:
-            log_warning("No features defined")
-            return
+    content = load_features_yaml(features_file, mutable=False)
+    if not content.get("features"):
+        log_warning("No features defined")
+        return
 
     features = content["features"]
     log_info(f"Features ({len(features)}):")
@@ -153,11 +146,10 @@ def show_feature(ctx: Context, feature_name: str):
         log_error("No features.yaml found")
         return
 
-    with open(features_file, "r") as f:
-        content = yaml.safe_load(f)
-        if not content or "features" not in content:
-            log_error("No features defined")
-            return
+    content = load_features_yaml(features_file, mutable=False)
+    if not content.get("features"):
+        log_error("No features defined")
+        return
 
     features = content["features"]
     if feature_name not in features:
@@ -181,8 +173,8 @@ def show_feature(ctx: Context, feature_name: str):
 
 class ListFeaturesModule(CommandModule):
     """List all defined features"""
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "List all defined features"
 
     def validate(self, ctx: Context) -> None:
@@ -195,8 +187,8 @@ class ListFeaturesModule(CommandModule):
 
 class ShowFeatureModule(CommandModule):
     """Show details of a specific feature"""
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Show details of a specific feature"
 
     def validate(self, ctx: Context) -> None:
@@ -209,14 +201,13 @@ class ShowFeatureModule(CommandModule):
 
 class AddUpdateFeatureModule(CommandModule):
     """Add or update a feature with files from a commit"""
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Add or update a feature with files from a commit"
 
     def validate(self, ctx: Context) -> None:
         """Validate git is available"""
-        import shutil
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
         if not ctx.chromium_src.exists():
             raise ValidationError(f"Chromium source not found: {ctx.chromium_src}")
@@ -240,8 +231,8 @@ AddFeatureModule = AddUpdateFeatureModule
 
 class ClassifyFeaturesModule(CommandModule):
     """Classify unclassified patch files into features"""
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Classify unclassified patch files into features"
 
     def validate(self, ctx: Context) -> None:
@@ -5,25 +5,33 @@ Provides functions to prompt users to select or create features
 and add files to them.
 """
 
+import copy
 import yaml
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple, Set
 
+from ...common.config import load_yaml_file
 from ...common.context import Context
-from ...common.utils import log_info, log_success, log_warning, log_error
+from ...common.utils import log_info, log_success, log_warning, log_error, iter_files
 from .validation import validate_feature_name, validate_description, VALID_PREFIXES
 
 
-def load_features_yaml(features_file: Path) -> Dict:
-    """Load features from YAML file."""
-    if not features_file.exists():
+def load_features_yaml(features_file: Path, mutable: bool = True) -> Dict:
+    """Load features from YAML file.
+
+    Parsing is cached per file version by load_yaml_file. By default
+    callers get their own deep copy and may modify it freely; read-only
+    callers can pass mutable=False to get the shared cached data without
+    copying it.
+    """
+    try:
+        content = load_yaml_file(features_file)
+    except FileNotFoundError:
         return {"version": "1.0", "features": {}}
 
-    with open(features_file, "r") as f:
-        content = yaml.safe_load(f)
-        if not content:
-            return {"version": "1.0", "features": {}}
-        return content
+    if not content:
+        return {"version": "1.0", "features": {}}
+    return copy.deepcopy(content) if mutable else content
 
 
 def save_features_yaml(features_file: Path, data: Dict) -> None:
@@ -48,7 +56,7 @@ def prompt_feature_selection(
         Tuple of (feature_name, description) or None if cancelled
     """
     features_file = ctx.get_features_yaml_path()
-    data = load_features_yaml(features_file)
+    data = load_features_yaml(features_file, mutable=False)
     features = data.get("features", {})
 
     # Display commit info if available
@@ -260,15 +268,12 @@ def get_all_patch_files(ctx: Context) -> List[str]:
         List of file paths (relative to chromium_patches/)
     """
     patches_dir = ctx.get_patches_dir()
-    if not patches_dir.exists():
-        return []
 
     patch_files = []
-    for patch_path in patches_dir.rglob("*"):
-        if patch_path.is_file():
-            # Get relative path from patches_dir
-            rel_path = str(patch_path.relative_to(patches_dir))
-            patch_files.append(rel_path)
+    for entry in iter_files(patches_dir):
+        # Get relative path from patches_dir
+        rel_path = str(Path(entry.path).relative_to(patches_dir))
+        patch_files.append(rel_path)
 
     return sorted(patch_files)
 
@@ -280,7 +285,7 @@ def get_all_classified_files(ctx: Context) -> Set[str]:
         Set of file paths
     """
     features_file = ctx.get_features_yaml_path()
-    data = load_features_yaml(features_file)
+    data = load_features_yaml(features_file, mutable=False)
     features = data.get("features", {})
 
     classified = set()
@@ -375,7 +380,7 @@ def prompt_feature_selection_for_file(
         Tuple of (feature_name, description) or None if skipped
     """
     features_file = ctx.get_features_yaml_path()
-    data = load_features_yaml(features_file)
+    data = load_features_yaml(features_file, mutable=False)
     features = data.get("features", {})
 
     if not features:
@@ -57,7 +57,7 @@ ENCLOSURE_TEMPLATE = """      <!-- {comment} -->
         type="application/zip"/>"""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SignedArtifact:
     """Represents a signed artifact with Sparkle signature"""
     platform: str
@@ -68,7 +68,7 @@ class SignedArtifact:
     arch: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExistingAppcast:
     """Parsed data from an existing appcast file"""
     version: str
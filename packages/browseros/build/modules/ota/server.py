@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Server OTA module for BrowserOS Server binary updates"""
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -46,8 +47,8 @@ class ServerOTAModule(CommandModule):
     5. Generate and upload appcast XML
     """
 
-    produces = ["server_ota_artifacts", "server_appcast"]
-    requires = []
+    produces = frozenset({"server_ota_artifacts", "server_appcast"})
+    requires = frozenset()
     description = "Create and upload BrowserOS Server OTA update"
 
     def __init__(
@@ -86,12 +87,17 @@ class ServerOTAModule(CommandModule):
                 raise ValidationError(f"Default binaries directory not found: {default_dir}")
             self.binaries_dir = default_dir
 
+        # One directory listing instead of a stat() per platform binary
+        with os.scandir(self.binaries_dir) as entries:
+            present = {entry.name for entry in entries}
+
         platforms = self._get_platforms()
         for p in platforms:
             binary_name = p["binary"]
-            binary_path = self.binaries_dir / binary_name
-            if not binary_path.exists():
-                raise ValidationError(f"Binary not found: {binary_path}")
+            if binary_name not in present:
+                raise ValidationError(
+                    f"Binary not found: {self.binaries_dir / binary_name}"
+                )
 
         if IS_MACOS():
             if not ctx.env.macos_certificate_name:
@@ -109,7 +115,7 @@ class ServerOTAModule(CommandModule):
     def _get_platforms(self) -> List[dict]:
         """Get platforms to process based on filter (supports comma-separated)"""
         if self.platform_filter:
-            requested = [p.strip() for p in self.platform_filter.split(",")]
+            requested = {p.strip() for p in self.platform_filter.split(",")}
             return [p for p in SERVER_PLATFORMS if p["name"] in requested]
         return SERVER_PLATFORMS
 
@@ -4,6 +4,7 @@
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -17,20 +18,18 @@ from ...common.utils import (
     run_command,
     safe_rmtree,
     join_paths,
-    IS_LINUX,
+    find_executable,
 )
 from ...common.notify import get_notifier, COLOR_GREEN
 
 
 class LinuxPackageModule(CommandModule):
-    produces = ["appimage", "deb"]
-    requires = []
+    produces = frozenset({"appimage", "deb"})
+    requires = frozenset()
     description = "Create AppImage and .deb packages for Linux"
+    supported_platforms = frozenset({"linux"})
 
     def validate(self, ctx: Context) -> None:
-        if not IS_LINUX():
-            raise ValidationError("Linux packaging requires Linux")
-
         out_dir = join_paths(ctx.chromium_src, ctx.out_dir)
         chrome_binary = join_paths(out_dir, ctx.BROWSEROS_APP_NAME)
 
@@ -45,8 +44,13 @@ class LinuxPackageModule(CommandModule):
         package_dir = ctx.get_dist_dir()
         package_dir.mkdir(parents=True, exist_ok=True)
 
-        appimage_path = self._package_appimage(ctx, package_dir)
-        deb_path = self._package_deb(ctx, package_dir)
+        # AppImage and .deb stage into separate directories and only read
+        # the build output, so build them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            appimage_future = executor.submit(self._package_appimage, ctx, package_dir)
+            deb_future = executor.submit(self._package_deb, ctx, package_dir)
+            appimage_path = appimage_future.result()
+            deb_path = deb_future.result()
 
         if appimage_path:
             ctx.artifact_registry.add("appimage", appimage_path)
@@ -93,6 +97,15 @@ class LinuxPackageModule(CommandModule):
 # =============================================================================
 
 
+def _copy_if_exists(src: Path, dst: Path) -> bool:
+    """Copy src to dst with metadata; False if src does not exist."""
+    try:
+        shutil.copy2(src, dst)
+    except FileNotFoundError:
+        return False
+    return True
+
+
 def copy_browser_files(
     ctx: Context, target_dir: Path, set_sandbox_suid: bool = True
 ) -> bool:
@@ -127,10 +140,19 @@ def copy_browser_files(
         "resources.pak",
     ]
 
-    for file in files_to_copy:
-        src = join_paths(out_dir, file)
-        if Path(src).exists():
-            shutil.copy2(src, join_paths(target_dir, file))
+    # Probe-and-copy each file concurrently; results are logged in list order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        copied = list(
+            executor.map(
+                lambda file: _copy_if_exists(
+                    join_paths(out_dir, file), join_paths(target_dir, file)
+                ),
+                files_to_copy,
+            )
+        )
+
+    for file, was_copied in zip(files_to_copy, copied):
+        if was_copied:
             log_info(f"  ✓ Copied {file}")
         else:
             log_warning(f"  ⚠ File not found: {file}")
@@ -320,8 +342,7 @@ def create_appimage(ctx: Context, appdir: Path, output_path: Path) -> bool:
     ]
 
     # Pass ARCH as environment variable to the subprocess
-    env = os.environ.copy()
-    env["ARCH"] = arch
+    env = {**os.environ, "ARCH": arch}
 
     result = subprocess.run(
         cmd,
@@ -469,7 +490,7 @@ def create_deb(ctx: Context, debdir: Path, output_path: Path) -> bool:
     log_info("📦 Creating .deb package...")
 
     # Verify dpkg-deb is available
-    if not shutil.which("dpkg-deb"):
+    if not find_executable("dpkg-deb"):
         log_error("dpkg-deb not found. Install with: sudo apt install dpkg")
         return False
 
@@ -506,8 +527,7 @@ def package_appimage(ctx: Context, package_dir: Path) -> Optional[Path]:
     log_info("🖼️  Building AppImage...")
 
     appdir = Path(join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}.AppDir"))
-    if appdir.exists():
-        safe_rmtree(appdir)
+    safe_rmtree(appdir)
 
     if not prepare_appdir(ctx, appdir):
         safe_rmtree(appdir)
@@ -536,8 +556,7 @@ def package_deb(ctx: Context, package_dir: Path) -> Optional[Path]:
     log_info("📦 Building .deb package...")
 
     debdir = Path(join_paths(package_dir, f"{ctx.BROWSEROS_APP_BASE_NAME}_deb"))
-    if debdir.exists():
-        safe_rmtree(debdir)
+    safe_rmtree(debdir)
 
     if not prepare_debdir(ctx, debdir):
         safe_rmtree(debdir)
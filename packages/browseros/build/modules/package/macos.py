@@ -1,24 +1,25 @@
 #!/usr/bin/env python3
 """DMG creation and packaging module for BrowserOS"""
 
-import shutil
 from pathlib import Path
 from typing import Optional, List
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import run_command, log_info, log_error, log_success, IS_MACOS
+from ...common.utils import run_command, log_info, log_error, log_success, find_executable
 from ...common.notify import get_notifier, COLOR_GREEN
 
+# LZFSE-compressed image (macOS 10.11+): much faster to create and to mount
+# than bzip2 (UDBZ), at a similar size
+DMG_FORMAT = "ULFO"
+
 
 class MacOSPackageModule(CommandModule):
-    produces = ["dmg"]
-    requires = []
+    produces = frozenset({"dmg"})
+    requires = frozenset()
     description = "Create DMG package for macOS"
+    supported_platforms = frozenset({"macos"})
 
     def validate(self, ctx: Context) -> None:
-        if not IS_MACOS():
-            raise ValidationError("DMG creation requires macOS")
-
         app_path = ctx.get_app_path()
         if not app_path.exists():
             raise ValidationError(f"App not found: {app_path}")
@@ -80,6 +81,7 @@ def create_dmg(
     dmg_path: Path,
     volume_name: str = "BrowserOS",
     pkg_dmg_path: Optional[Path] = None,
+    dmg_format: str = DMG_FORMAT,
 ) -> bool:
     """Create a DMG package from an app bundle"""
     log_info(f"\n📀 Creating DMG package: {dmg_path.name}")
@@ -105,7 +107,7 @@ def create_dmg(
         cmd = [str(pkg_dmg_path)]
     else:
         # Fallback to system pkg-dmg if available
-        pkg_dmg_system = shutil.which("pkg-dmg")
+        pkg_dmg_system = find_executable("pkg-dmg")
         if pkg_dmg_system:
             cmd = [pkg_dmg_system]
         else:
@@ -124,7 +126,7 @@ def create_dmg(
             "--symlink",
             "/Applications:/Applications",
             "--format",
-            "UDBZ",
+            dmg_format,
         ]
     )
 
@@ -319,12 +321,7 @@ def package_universal(contexts: List[Context]) -> bool:
         return False
 
     # Create a temporary universal context for DMG naming
-    universal_ctx = Context(
-        root_dir=contexts[0].root_dir,
-        chromium_src=contexts[0].chromium_src,
-        architecture="universal",
-        build_type=contexts[0].build_type,
-    )
+    universal_ctx = contexts[0].for_architecture("universal")
 
     # Create DMG in dist/<version> directory
     dmg_dir = universal_ctx.get_dist_dir()
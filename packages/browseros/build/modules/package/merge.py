@@ -6,6 +6,7 @@ Provides functions to merge two architecture builds into a universal binary
 
 import sys
 import shutil
+import traceback
 from pathlib import Path
 from ...common.context import Context
 from ...common.utils import run_command, log_info, log_error, log_success
@@ -159,6 +160,15 @@ def merge_sign_package(
     ):
         return False
 
+    # Sign and package work on the same universal app, so build its context once
+    ctx = None
+    if sign or package:
+        try:
+            ctx = create_minimal_context(output_path, chromium_src, root_dir)
+        except Exception as e:
+            log_error(f"Failed to create build context: {e}")
+            return False
+
     # Step 2: Sign (if requested)
     if sign:
         log_info("\n" + "=" * 70)
@@ -168,7 +178,6 @@ def merge_sign_package(
         try:
             from ..sign import sign_app
 
-            ctx = create_minimal_context(output_path, chromium_src, root_dir)
             if not sign_app(ctx, create_dmg=False):
                 log_error("Failed to sign universal binary")
                 return False
@@ -191,8 +200,6 @@ def merge_sign_package(
         try:
             from . import create_dmg
 
-            ctx = create_minimal_context(output_path, chromium_src, root_dir)
-
             # Create DMG in parent directory
             dmg_dir = ctx.root_dir / "dmg"
             dmg_dir.mkdir(parents=True, exist_ok=True)
@@ -265,21 +272,16 @@ def handle_merge_command(
         return False
 
     # Auto-generate output path in chromium source
-    # Get the app name from BuildContext
-    from ...common.context import Context
+    # Get the app name from BuildConfig; a full Context would also read the
+    # version files, and merge_sign_package builds the real one later
+    from ...common.context import BuildConfig
     from ...common.paths import get_package_root
 
     root_dir = get_package_root()
     log_info(f"📂 Using root directory: {root_dir}")
 
-    temp_ctx = Context(
-        chromium_src=chromium_src,
-        architecture="universal",
-        build_type="release",
-    )
-    output_path = (
-        chromium_src / "out" / "Default_universal" / temp_ctx.BROWSEROS_APP_NAME
-    )
+    app_name = BuildConfig("universal", "release").BROWSEROS_APP_NAME
+    output_path = chromium_src / "out" / "Default_universal" / app_name
     log_info(f"  Output: {output_path} (auto-generated)")
 
     try:
@@ -301,7 +303,5 @@ def handle_merge_command(
         return success
     except Exception as e:
         log_error(f"Merge command failed with exception: {e}")
-        import traceback
-
         traceback.print_exc()
         return False
@@ -1,19 +1,18 @@
 #!/usr/bin/env python3
 """Patch management module for BrowserOS build system"""
 
-import shutil
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import log_info, log_error
+from ...common.utils import log_info, log_error, find_executable
 
 
 class PatchesModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Apply BrowserOS patches to Chromium"
 
     def validate(self, ctx: Context) -> None:
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError(
                 "Git is not available in PATH - required for applying patches"
             )
@@ -40,13 +39,12 @@ def apply_patches_impl(ctx: Context, interactive: bool = False) -> bool:
     log_info("\n🩹 Applying patches using dev CLI system...")
 
     # Check if git is available
-    if not shutil.which("git"):
+    if not find_executable("git"):
         log_error("Git is not available in PATH")
         log_error("Please install Git to apply patches")
         raise RuntimeError("Git not found in PATH")
 
-    # Import apply module via package path so relative imports work
-    from build.modules.apply.apply_all import apply_all_patches
+    from ..apply.apply_all import apply_all_patches
 
     # Call the dev CLI function directly
     _, failed = apply_all_patches(
@@ -1,26 +1,25 @@
 #!/usr/bin/env python3
 """Series-based patch module for BrowserOS build system (GNU Quilt format)"""
 
-import shutil
 import subprocess
 from pathlib import Path
 from typing import Iterator
 
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import log_info, log_success, log_error, get_platform
+from ...common.utils import log_info, log_success, log_error, get_platform, find_executable
 
 
 ENCODING = "UTF-8"
 
 
 class SeriesPatchesModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Apply series-based patches (GNU Quilt format)"
 
     def validate(self, ctx: Context) -> None:
-        if not shutil.which("git"):
+        if not find_executable("git"):
             raise ValidationError("Git is not available in PATH")
 
         series_dir = ctx.get_series_patches_dir()
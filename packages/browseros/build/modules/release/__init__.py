@@ -12,20 +12,42 @@ from .common import (
     get_repo_from_git,
     check_gh_cli,
 )
-from .list import ListModule
-from .appcast import AppcastModule
-from .github import GithubModule
-from .publish import PublishModule
-from .download import DownloadModule
-
-AVAILABLE_MODULES = {
-    "list": ListModule,
-    "appcast": AppcastModule,
-    "github": GithubModule,
-    "publish": PublishModule,
-    "download": DownloadModule,
+from ...common.module import LazyModuleRegistry
+
+# Release modules are imported on first lookup, so each release command only
+# loads the module it runs
+AVAILABLE_MODULES = LazyModuleRegistry(
+    {
+        "list": ".list:ListModule",
+        "appcast": ".appcast:AppcastModule",
+        "github": ".github:GithubModule",
+        "publish": ".publish:PublishModule",
+        "download": ".download:DownloadModule",
+    },
+    __name__,
+)
+
+_MODULE_CLASSES = {
+    "ListModule": "list",
+    "AppcastModule": "appcast",
+    "GithubModule": "github",
+    "PublishModule": "publish",
+    "DownloadModule": "download",
 }
 
+
+def __getattr__(name: str):
+    module_name = _MODULE_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = AVAILABLE_MODULES[module_name]
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_CLASSES))
+
 __all__ = [
     "PLATFORMS",
     "PLATFORM_DISPLAY_NAMES",
@@ -11,8 +11,8 @@ from .common import fetch_all_release_metadata, generate_appcast_item
 class AppcastModule(CommandModule):
     """Generate appcast XML snippets for macOS auto-update"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Generate Sparkle appcast XML snippets"
 
     def validate(self, ctx: Context) -> None:
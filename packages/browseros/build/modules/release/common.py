@@ -2,6 +2,7 @@
 """Common utilities for release modules"""
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -35,11 +36,21 @@ def fetch_all_release_metadata(
     if env is None:
         env = EnvConfig()
 
-    metadata = {}
-    for platform in PLATFORMS:
-        release_data = get_release_json(version, platform, env)
-        if release_data:
-            metadata[platform] = release_data
+    # Create the shared client up front: boto3 client creation is not
+    # thread-safe, but the cached client is safe to use from the workers
+    if BOTO3_AVAILABLE and env.has_r2_config():
+        get_r2_client(env)
+
+    # The per-platform GETs are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(PLATFORMS)) as executor:
+        results = executor.map(
+            lambda platform: get_release_json(version, platform, env), PLATFORMS
+        )
+
+        metadata = {}
+        for platform, release_data in zip(PLATFORMS, results):
+            if release_data:
+                metadata[platform] = release_data
 
     return metadata
 
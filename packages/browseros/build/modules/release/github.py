@@ -131,8 +131,8 @@ def download_and_upload_artifacts(
 class GithubModule(CommandModule):
     """Create GitHub release from R2 artifacts"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Create GitHub release from R2 artifacts"
 
     def __init__(
@@ -17,8 +17,8 @@ from .common import (
 class ListModule(CommandModule):
     """List release artifacts from R2 for a version"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "List release artifacts from R2"
 
     def validate(self, ctx: Context) -> None:
@@ -37,8 +37,8 @@ def copy_to_download_path(
 class PublishModule(CommandModule):
     """Copy versioned artifacts to download/ paths (make release "live")"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Publish versioned artifacts to latest download URLs"
 
     def __init__(self, platforms: List[str] = None):
@@ -7,11 +7,15 @@ from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import log_info, log_success, log_error
 
+# Replacement files with one of these suffixes only apply to that build type
+BUILD_TYPE_SUFFIXES = frozenset({".debug", ".release"})
+
 
 class ChromiumReplaceModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Replace Chromium source files with custom versions"
+    parallel_safe = True  # Only writes files mirrored from chromium_files/
 
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src.exists():
@@ -38,15 +42,19 @@ def replace_chromium_files_impl(ctx: Context, replacements=None) -> bool:
     replaced_count = 0
     skipped_count = 0
 
+    # Suffix of the variants that apply to this build; decided once instead of
+    # comparing the build type for every file
+    wanted_suffix = f".{ctx.build_type}"
+    if wanted_suffix not in BUILD_TYPE_SUFFIXES:
+        wanted_suffix = None
+
     # Find all files recursively in the replacement directory
     for src_file in replacement_dir.rglob("*"):
         if src_file.is_file():
             # Skip build-type specific files that don't match current build type
-            if src_file.suffix in [".debug", ".release"]:
+            if src_file.suffix in BUILD_TYPE_SUFFIXES:
                 # Check if this file matches the current build type
-                if (ctx.build_type == "debug" and src_file.suffix != ".debug") or (
-                    ctx.build_type == "release" and src_file.suffix != ".release"
-                ):
+                if wanted_suffix and src_file.suffix != wanted_suffix:
                     skipped_count += 1
                     continue
 
@@ -60,13 +68,10 @@ def replace_chromium_files_impl(ctx: Context, replacements=None) -> bool:
                 relative_path = src_file.relative_to(replacement_dir)
                 dest_relative = relative_path
 
-                # Check if build-type specific version exists
-                debug_variant = src_file.with_suffix(src_file.suffix + ".debug")
-                release_variant = src_file.with_suffix(src_file.suffix + ".release")
-
                 # If a build-type specific variant exists for current build type, skip the generic file
-                if (ctx.build_type == "debug" and debug_variant.exists()) or (
-                    ctx.build_type == "release" and release_variant.exists()
+                if (
+                    wanted_suffix
+                    and src_file.with_suffix(src_file.suffix + wanted_suffix).exists()
                 ):
                     log_info(
                         f"    ⏭️  Skipping {relative_path} (using {ctx.build_type} variant instead)"
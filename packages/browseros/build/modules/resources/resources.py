@@ -3,17 +3,25 @@
 
 import glob
 import shutil
-import yaml
 import subprocess
 from pathlib import Path
 from ...common.module import CommandModule, ValidationError
+from ...common.config import load_yaml_file
 from ...common.context import Context
-from ...common.utils import log_info, log_success, log_error, log_warning, get_platform
+from ...common.utils import (
+    log_info,
+    log_success,
+    log_error,
+    log_warning,
+    get_platform,
+    fast_copy,
+    link_or_copy,
+)
 
 
 class ResourcesModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Copy resources (icons, extensions) to Chromium"
 
     def validate(self, ctx: Context) -> None:
@@ -39,8 +47,7 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
             f"Copy configuration file not found: {copy_config_path}"
         )
 
-    with open(copy_config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml_file(copy_config_path)
 
     if "copy_operations" not in config:
         log_info("⚠️  No copy_operations defined in configuration")
@@ -51,6 +58,9 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
             "📝 Git commit mode enabled - will create a commit after each resource copy"
         )
 
+    # Conditions are checked against the same platform for every operation
+    current_os = get_platform()
+
     # Process each copy operation
     for operation in config["copy_operations"]:
         name = operation.get("name", "Unnamed operation")
@@ -69,26 +79,28 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
             continue
 
         # Skip operation if os condition doesn't match
-        if os_condition:
-            current_os = get_platform()
-            if current_os not in os_condition:
-                log_info(
-                    f"  ⏭️  Skipping {name} (os: {os_condition}, current: {current_os})"
-                )
-                continue
+        if os_condition and current_os not in os_condition:
+            log_info(
+                f"  ⏭️  Skipping {name} (os: {os_condition}, current: {current_os})"
+            )
+            continue
 
         # Skip operation if arch condition doesn't match
-        if arch_condition:
-            if ctx.architecture not in arch_condition:
-                log_info(
-                    f"  ⏭️  Skipping {name} (arch: {arch_condition}, current: {ctx.architecture})"
-                )
-                continue
+        if arch_condition and ctx.architecture not in arch_condition:
+            log_info(
+                f"  ⏭️  Skipping {name} (arch: {arch_condition}, current: {ctx.architecture})"
+            )
+            continue
 
         # Resolve paths
         src_path = ctx.root_dir / source
         dst_base = ctx.chromium_src / destination
 
+        # Opt-in hardlinking for large sources nothing modifies in place
+        copy_file = (
+            link_or_copy if operation.get("link_mode") == "hardlink" else fast_copy
+        )
+
         log_info(f"  • {name}")
 
         try:
@@ -97,7 +109,12 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
                 if src_path.exists() and src_path.is_dir():
                     dst_path = dst_base
                     dst_path.mkdir(parents=True, exist_ok=True)
-                    shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
+                    shutil.copytree(
+                        src_path,
+                        dst_path,
+                        dirs_exist_ok=True,
+                        copy_function=copy_file,
+                    )
                     log_info(f"    ✓ Copied directory: {source} → {destination}")
                     if commit_each:
                         commit_resource_copy(
@@ -114,7 +131,7 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
                     for file_path in files:
                         file_path = Path(file_path)
                         if file_path.is_file():
-                            shutil.copy2(file_path, dst_base)
+                            copy_file(file_path, dst_base)
                     log_info(
                         f"    ✓ Copied {len(files)} files: {source} → {destination}"
                     )
@@ -129,7 +146,7 @@ def copy_resources_impl(ctx: Context, commit_each: bool = False) -> bool:
                 # Copy single file
                 if src_path.exists() and src_path.is_file():
                     dst_base.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_path, dst_base)
+                    copy_file(src_path, dst_base)
                     log_info(f"    ✓ Copied file: {source} → {destination}")
                     if commit_each:
                         commit_resource_copy(
@@ -8,9 +8,10 @@ from ...common.utils import log_info, log_success, log_error, log_warning
 
 
 class StringReplacesModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Apply branding string replacements in Chromium"
+    parallel_safe = True  # Only edits the .grd/.grdp files in target_files
 
     def validate(self, ctx: Context) -> None:
         if not ctx.chromium_src.exists():
@@ -40,6 +41,12 @@ branding_replacements = [
     (r"Chrome", r"BrowserOS"),
 ]
 
+# branding_replacements compiled once at import
+_compiled_replacements = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in branding_replacements
+]
+
 # List of files to apply replacements to
 target_files = [
     "chrome/app/chromium_strings.grd",
@@ -69,13 +76,14 @@ def apply_string_replacements_impl(ctx: Context) -> bool:
             original_content = content
             replacement_count = 0
 
-            # Apply each replacement
-            for pattern, replacement in branding_replacements:
-                matches = len(re.findall(pattern, content))
+            # Apply each replacement, counting matches in the same pass
+            for pattern, replacement in _compiled_replacements:
+                content, matches = pattern.subn(replacement, content)
                 if matches > 0:
-                    content = re.sub(pattern, replacement, content)
                     replacement_count += matches
-                    log_info(f"    ✓ Replaced {matches} occurrences of '{pattern}'")
+                    log_info(
+                        f"    ✓ Replaced {matches} occurrences of '{pattern.pattern}'"
+                    )
 
             # Write back if changes were made
             if content != original_content:
@@ -1,14 +1,41 @@
 #!/usr/bin/env python3
 """Clean module for BrowserOS build system"""
 
+import shlex
+
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
-from ...common.utils import run_command, log_info, log_success, safe_rmtree
+from ...common.utils import (
+    run_command,
+    log_info,
+    log_success,
+    safe_rmtree,
+    IS_WINDOWS,
+)
+
+# --quiet: the per-file "Removing ..." listing on a Chromium tree can run to
+# tens of thousands of lines that run_command would echo, log and buffer.
+# Errors still come through on stderr.
+GIT_RESET_CMD = ["git", "reset", "--hard", "--quiet", "HEAD"]
+GIT_CLEAN_CMD = [
+    "git",
+    "clean",
+    "-fdx",
+    "--quiet",
+    "chrome/",
+    "components/",
+    "--exclude=third_party/",
+    "--exclude=build_tools/",
+    "--exclude=uc_staging/",
+    "--exclude=buildtools/",
+    "--exclude=tools/",
+    "--exclude=build/",
+]
 
 
 class CleanModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Clean build artifacts and reset git state"
 
     def validate(self, ctx: Context) -> None:
@@ -19,8 +46,7 @@ class CleanModule(CommandModule):
         log_info("🧹 Cleaning build artifacts...")
 
         out_path = ctx.chromium_src / ctx.out_dir
-        if out_path.exists():
-            safe_rmtree(out_path)
+        if safe_rmtree(out_path):
             log_success("Cleaned build directory")
 
         log_info("\n🔀 Resetting git branch and removing tracked files...")
@@ -30,29 +56,16 @@ class CleanModule(CommandModule):
         self._clean_sparkle(ctx)
 
     def _clean_sparkle(self, ctx: Context) -> None:
-        sparkle_dir = ctx.get_sparkle_dir()
-        if sparkle_dir.exists():
-            safe_rmtree(sparkle_dir)
+        safe_rmtree(ctx.get_sparkle_dir())
         log_success("Cleaned Sparkle build directory")
 
     def _git_reset(self, ctx: Context) -> None:
-        run_command(["git", "reset", "--hard", "HEAD"], cwd=ctx.chromium_src)
-
-        log_info("🧹 Running git clean with exclusions...")
-        run_command(
-            [
-                "git",
-                "clean",
-                "-fdx",
-                "chrome/",
-                "components/",
-                "--exclude=third_party/",
-                "--exclude=build_tools/",
-                "--exclude=uc_staging/",
-                "--exclude=buildtools/",
-                "--exclude=tools/",
-                "--exclude=build/",
-            ],
-            cwd=ctx.chromium_src,
-        )
+        log_info("🧹 Running git reset and git clean with exclusions...")
+        if IS_WINDOWS():
+            run_command(GIT_RESET_CMD, cwd=ctx.chromium_src)
+            run_command(GIT_CLEAN_CMD, cwd=ctx.chromium_src)
+        else:
+            # One shell invocation instead of two separate git launches
+            script = f"{shlex.join(GIT_RESET_CMD)} && {shlex.join(GIT_CLEAN_CMD)}"
+            run_command(["sh", "-c", script], cwd=ctx.chromium_src)
         log_success("Git reset and clean complete")
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Build configuration module for BrowserOS build system"""
 
+from functools import lru_cache
+from pathlib import Path
+
 from ...common.module import CommandModule, ValidationError
 from ...common.context import Context
 from ...common.utils import run_command, log_info, log_success, join_paths, IS_WINDOWS
 
 
 class ConfigureModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Configure build with GN"
 
     def validate(self, ctx: Context) -> None:
@@ -31,7 +34,7 @@ class ConfigureModule(CommandModule):
         flags_file = join_paths(ctx.root_dir, ctx.paths.gn_flags_file)
         args_file = ctx.get_gn_args_file()
 
-        args_content = flags_file.read_text()
+        args_content = _read_gn_flags(flags_file)
         args_content += f'\ntarget_cpu = "{ctx.architecture}"\n'
 
         args_file.write_text(args_content)
@@ -40,3 +43,9 @@ class ConfigureModule(CommandModule):
         run_command([gn_cmd, "gen", ctx.out_dir, "--fail-on-unused-args"], cwd=ctx.chromium_src)
 
         log_success("Build configured")
+
+
+@lru_cache(maxsize=None)
+def _read_gn_flags(flags_file: Path) -> str:
+    """Read a GN flags file once per process (shared by per-arch configures)"""
+    return flags_file.read_text()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Git operations module for BrowserOS build system"""
 
+import os
 import subprocess
 import tarfile
 import urllib.request
@@ -10,8 +11,8 @@ from ...common.utils import run_command, log_info, log_error, log_success, IS_WI
 
 
 class GitSetupModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Checkout Chromium version and sync dependencies"
 
     def validate(self, ctx: Context) -> None:
@@ -24,8 +25,7 @@ class GitSetupModule(CommandModule):
     def execute(self, ctx: Context) -> None:
         log_info(f"\n🔀 Setting up Chromium {ctx.chromium_version}...")
 
-        log_info("📥 Fetching all tags from remote...")
-        run_command(["git", "fetch", "--tags", "--force"], cwd=ctx.chromium_src)
+        self._fetch_tag(ctx)
 
         self._verify_tag_exists(ctx)
 
@@ -33,13 +33,30 @@ class GitSetupModule(CommandModule):
         run_command(["git", "checkout", f"tags/{ctx.chromium_version}"], cwd=ctx.chromium_src)
 
         log_info("📥 Syncing dependencies (this may take a while)...")
-        if IS_WINDOWS():
-            run_command(["gclient.bat", "sync", "-D", "--no-history", "--shallow"], cwd=ctx.chromium_src)
-        else:
-            run_command(["gclient", "sync", "-D", "--no-history", "--shallow"], cwd=ctx.chromium_src)
+        gclient = "gclient.bat" if IS_WINDOWS() else "gclient"
+        # DEPS fetches are network-bound, so run one per core
+        jobs = str(os.cpu_count() or 8)
+        run_command(
+            [gclient, "sync", "-D", "--no-history", "--shallow", "--jobs", jobs],
+            cwd=ctx.chromium_src,
+        )
 
         log_success("Git setup complete")
 
+    def _fetch_tag(self, ctx: Context) -> None:
+        # Fetch just the tag being built; Chromium has tens of thousands of
+        # tags, so --tags spends most of its time negotiating refs
+        tag_ref = f"refs/tags/{ctx.chromium_version}"
+        log_info(f"📥 Fetching tag {ctx.chromium_version} from remote...")
+        result = run_command(
+            ["git", "fetch", "--force", "--no-tags", "origin", f"{tag_ref}:{tag_ref}"],
+            cwd=ctx.chromium_src,
+            check=False,
+        )
+        if result.returncode != 0:
+            log_info("📥 Fetching all tags from remote...")
+            run_command(["git", "fetch", "--tags", "--force"], cwd=ctx.chromium_src)
+
     def _verify_tag_exists(self, ctx: Context) -> None:
         result = subprocess.run(
             ["git", "tag", "-l", ctx.chromium_version],
@@ -63,35 +80,28 @@ class GitSetupModule(CommandModule):
 
 
 class SparkleSetupModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Download and setup Sparkle framework (macOS only)"
+    supported_platforms = frozenset({"macos"})
 
     def validate(self, ctx: Context) -> None:
-        from ...common.utils import IS_MACOS
-        if not IS_MACOS():
-            raise ValidationError("Sparkle setup requires macOS")
+        pass
 
     def execute(self, ctx: Context) -> None:
         log_info("\n✨ Setting up Sparkle framework...")
 
         sparkle_dir = ctx.get_sparkle_dir()
 
-        if sparkle_dir.exists():
-            safe_rmtree(sparkle_dir)
-
+        safe_rmtree(sparkle_dir)
         sparkle_dir.mkdir(parents=True)
 
         sparkle_url = ctx.get_sparkle_url()
-        sparkle_archive = sparkle_dir / "sparkle.tar.xz"
-
-        log_info(f"Downloading Sparkle from {sparkle_url}...")
-        urllib.request.urlretrieve(sparkle_url, sparkle_archive)
-
-        log_info("Extracting Sparkle...")
-        with tarfile.open(sparkle_archive, "r:xz") as tar:
-            tar.extractall(sparkle_dir)
 
-        sparkle_archive.unlink()
+        # Extract while downloading; the archive is never written to disk
+        log_info(f"Downloading and extracting Sparkle from {sparkle_url}...")
+        with urllib.request.urlopen(sparkle_url) as response:
+            with tarfile.open(fileobj=response, mode="r|xz") as tar:
+                tar.extractall(sparkle_dir)
 
         log_success("Sparkle setup complete")
@@ -8,8 +8,8 @@ from ...common.utils import log_info, log_warning
 
 
 class LinuxSignModule(CommandModule):
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Linux code signing (no-op)"
 
     def validate(self, ctx: Context) -> None:
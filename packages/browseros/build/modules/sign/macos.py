@@ -5,6 +5,7 @@ import os
 import sys
 import subprocess
 import shutil
+import traceback
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 from ...common.module import CommandModule, ValidationError
@@ -36,6 +37,19 @@ BROWSEROS_SERVER_BINARIES: Dict[str, Dict[str, str]] = {
     },
 }
 
+# Identifiers for known components, matched in order against the component
+# path; {base} is replaced with the base identifier
+SPECIAL_IDENTIFIERS: Dict[str, str] = {
+    "Downloader": "org.sparkle-project.Downloader",
+    "Installer": "org.sparkle-project.Installer",
+    "Updater": "org.sparkle-project.Updater",
+    "Autoupdate": "org.sparkle-project.Autoupdate",
+    "Sparkle": "org.sparkle-project.Sparkle",
+    "chrome_crashpad_handler": "{base}.crashpad_handler",
+    "app_mode_loader": "{base}.app_mode_loader",
+    "web_app_shortcut_copier": "{base}.web_app_shortcut_copier",
+}
+
 
 def get_browseros_server_binary_info(component_path: Path) -> Optional[Dict[str, str]]:
     """Return metadata for known BrowserOS Server binaries, if applicable."""
@@ -53,14 +67,12 @@ def run_command(
 
 
 class MacOSSignModule(CommandModule):
-    produces = ["signed_app"]
-    requires = ["built_app"]
+    produces = frozenset({"signed_app"})
+    requires = frozenset({"built_app"})
     description = "Sign and notarize macOS application"
+    supported_platforms = frozenset({"macos"})
 
     def validate(self, ctx: Context) -> None:
-        if not IS_MACOS:
-            raise ValidationError("macOS signing requires macOS")
-
         app_path = ctx.get_app_path()
         if not app_path.exists():
             raise ValidationError(f"App not found at: {app_path}")
@@ -100,6 +112,17 @@ class MacOSSignModule(CommandModule):
     def _notarize(self, app_path: Path, env_vars: Dict[str, str], ctx: Context) -> None:
         if not notarize_app(app_path, ctx.root_dir, env_vars, ctx):
             raise RuntimeError("Notarization failed")
+
+
+# Environment variables check_signing_environment() requires
+SIGNING_ENV_VARS = (
+    "MACOS_CERTIFICATE_NAME",
+    "PROD_MACOS_NOTARIZATION_APPLE_ID",
+    "PROD_MACOS_NOTARIZATION_TEAM_ID",
+    "PROD_MACOS_NOTARIZATION_PWD",
+)
+
+
 def check_signing_environment(env: Optional[EnvConfig] = None) -> bool:
     """Check if all required environment variables are set for signing (early check)
 
@@ -107,23 +130,13 @@ def check_signing_environment(env: Optional[EnvConfig] = None) -> bool:
         env: Optional EnvConfig instance. If not provided, creates a new one.
     """
     # Only check on macOS
-    if not IS_MACOS:
+    if not IS_MACOS():
         return True
 
     if env is None:
         env = EnvConfig()
 
-    missing = []
-
-    if not env.macos_certificate_name:
-        missing.append("MACOS_CERTIFICATE_NAME")
-    if not env.macos_notarization_apple_id:
-        missing.append("PROD_MACOS_NOTARIZATION_APPLE_ID")
-    if not env.macos_notarization_team_id:
-        missing.append("PROD_MACOS_NOTARIZATION_TEAM_ID")
-    if not env.macos_notarization_password:
-        missing.append("PROD_MACOS_NOTARIZATION_PWD")
-
+    missing = env.missing_vars(*SIGNING_ENV_VARS)
     if missing:
         log_error("❌ Signing requires macOS environment variables!")
         log_error(f"Missing environment variables: {', '.join(missing)}")
@@ -149,16 +162,7 @@ def check_environment(env: Optional[EnvConfig] = None) -> Tuple[bool, Dict[str,
         "notarization_pwd": env.macos_notarization_password or "",
     }
 
-    missing = []
-    for key, value in env_vars.items():
-        if not value:
-            env_name = {
-                "certificate_name": "MACOS_CERTIFICATE_NAME",
-                "apple_id": "PROD_MACOS_NOTARIZATION_APPLE_ID",
-                "team_id": "PROD_MACOS_NOTARIZATION_TEAM_ID",
-                "notarization_pwd": "PROD_MACOS_NOTARIZATION_PWD",
-            }[key]
-            missing.append(env_name)
+    missing = env.missing_vars(*SIGNING_ENV_VARS)
 
     if missing:
         log_error(f"Required environment variables not set: {', '.join(missing)}")
@@ -267,22 +271,11 @@ def get_identifier_for_component(
     """Generate identifier for a component based on its path and name"""
     name = component_path.stem
 
-    # Special cases for known components
-    special_identifiers = {
-        "Downloader": "org.sparkle-project.Downloader",
-        "Installer": "org.sparkle-project.Installer",
-        "Updater": "org.sparkle-project.Updater",
-        "Autoupdate": "org.sparkle-project.Autoupdate",
-        "Sparkle": "org.sparkle-project.Sparkle",
-        "chrome_crashpad_handler": f"{base_identifier}.crashpad_handler",
-        "app_mode_loader": f"{base_identifier}.app_mode_loader",
-        "web_app_shortcut_copier": f"{base_identifier}.web_app_shortcut_copier",
-    }
-
     # Check for special cases
-    for key, identifier in special_identifiers.items():
-        if key in str(component_path):
-            return identifier
+    path_str = str(component_path)
+    for key, identifier in SPECIAL_IDENTIFIERS.items():
+        if key in path_str:
+            return identifier.format(base=base_identifier)
 
     # BrowserOS Server binaries share the same entitlements/options but need unique identifiers.
     browseros_server_info = get_browseros_server_binary_info(component_path)
@@ -758,7 +751,7 @@ def sign_app(ctx: Context, create_dmg: bool = True) -> bool:
 
         # Create and notarize DMG if requested
         if create_dmg:
-            print("\n" + "=" * 70)
+            log_info("\n" + "=" * 70)
             log_info("📦 Creating and notarizing DMG package")
             log_info("=" * 70)
 
@@ -781,8 +774,6 @@ def sign_app(ctx: Context, create_dmg: bool = True) -> bool:
 
     except Exception as e:
         track_error(f"Unexpected error: {e}")
-        import traceback
-
         traceback.print_exc()
         error_count += 1  # For the exception itself
 
@@ -859,12 +850,7 @@ def sign_universal(contexts: List[Context]) -> bool:
         log_success(f"Universal binary created: {universal_app_path}")
 
         # Create a temporary context for universal signing
-        universal_ctx = Context(
-            root_dir=contexts[0].root_dir,
-            chromium_src=contexts[0].chromium_src,
-            architecture="universal",
-            build_type=contexts[0].build_type,
-        )
+        universal_ctx = contexts[0].for_architecture("universal")
         # Override out_dir for universal
         universal_ctx.out_dir = "out/Default_universal"
 
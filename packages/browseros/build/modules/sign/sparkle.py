@@ -17,8 +17,8 @@ from ...common.utils import (
 class SparkleSignModule(CommandModule):
     """Sign DMGs with Sparkle for macOS auto-update"""
 
-    produces = ["sparkle_signatures"]
-    requires = []
+    produces = frozenset({"sparkle_signatures"})
+    requires = frozenset()
     description = "Sign DMG files with Sparkle Ed25519 key for auto-update"
 
     def validate(self, ctx: Context) -> None:
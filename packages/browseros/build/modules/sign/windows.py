@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Windows signing module for BrowserOS"""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import List, Optional
@@ -13,7 +14,6 @@ from ...common.utils import (
     log_success,
     log_warning,
     join_paths,
-    IS_WINDOWS,
 )
 
 BROWSEROS_SERVER_BINARIES: List[str] = [
@@ -23,14 +23,12 @@ BROWSEROS_SERVER_BINARIES: List[str] = [
 
 
 class WindowsSignModule(CommandModule):
-    produces = ["signed_installer"]
-    requires = ["built_app"]
+    produces = frozenset({"signed_installer"})
+    requires = frozenset({"built_app"})
     description = "Sign Windows binaries and create signed installer"
+    supported_platforms = frozenset({"windows"})
 
     def validate(self, ctx: Context) -> None:
-        if not IS_WINDOWS():
-            raise ValidationError("Windows signing requires Windows")
-
         build_output_dir = join_paths(ctx.chromium_src, ctx.out_dir)
         if not build_output_dir.exists():
             raise ValidationError(f"Build output directory not found: {build_output_dir}")
@@ -151,6 +149,7 @@ def sign_with_codesigntool(
         return False
 
     all_success = True
+    signed_binaries = []
     for binary in binaries:
         try:
             log_info(f"Signing {binary.name}...")
@@ -220,38 +219,69 @@ def sign_with_codesigntool(
             except Exception:
                 pass
 
-            verify_cmd = [
-                "powershell",
-                "-Command",
-                f"(Get-AuthenticodeSignature '{binary}').Status",
-            ]
-            try:
-                verify_result = subprocess.run(
-                    verify_cmd, capture_output=True, text=True
-                )
-                if "Valid" in verify_result.stdout:
-                    log_success(f"✓ {binary.name} signed and verified successfully")
-                else:
-                    log_error(
-                        f"✗ {binary.name} signing verification failed - Status: {verify_result.stdout.strip()}"
-                    )
-                    all_success = False
-            except Exception:
-                log_warning(f"Could not verify signature for {binary.name}")
+            signed_binaries.append(binary)
 
         except Exception as e:
             log_error(f"Failed to sign {binary.name}: {e}")
             all_success = False
 
+    if signed_binaries and not verify_signatures(signed_binaries):
+        all_success = False
+
     return all_success
 
 
+def verify_signatures(binaries: List[Path]) -> bool:
+    """Check the Authenticode status of binaries with a single PowerShell run
+
+    PowerShell takes far longer to start than to check a signature, so all
+    binaries are passed to one Get-AuthenticodeSignature call, which prints
+    a "path|status" line per file. Statuses are matched back by path, and a
+    binary with no line of its own counts as a failure.
+    """
+    file_list = ",".join(f"'{binary}'" for binary in binaries)
+    verify_cmd = [
+        "powershell",
+        "-Command",
+        f"Get-AuthenticodeSignature {file_list} | "
+        f'ForEach-Object {{ "$($_.Path)|$($_.Status)" }}',
+    ]
+    try:
+        verify_result = subprocess.run(verify_cmd, capture_output=True, text=True)
+    except Exception:
+        log_warning("Could not verify signatures")
+        return True
+
+    statuses = {}
+    for line in verify_result.stdout.splitlines():
+        path, sep, status = line.strip().rpartition("|")
+        if sep:
+            statuses[os.path.normcase(os.path.abspath(path))] = status
+
+    all_valid = True
+    for binary in binaries:
+        status = statuses.get(os.path.normcase(os.path.abspath(binary)))
+        if status == "Valid":
+            log_success(f"✓ {binary.name} signed and verified successfully")
+        elif status is None:
+            log_error(f"✗ {binary.name} signing verification failed - no status reported")
+            all_valid = False
+        else:
+            log_error(f"✗ {binary.name} signing verification failed - Status: {status}")
+            all_valid = False
+    return all_valid
+
+
 def sign_universal(contexts: List[Context]) -> bool:
     """Windows doesn't support universal binaries"""
     log_warning("Universal signing is not supported on Windows")
     return True
 
 
+# eSigner credentials check_signing_environment() requires
+SIGNING_ENV_VARS = ("ESIGNER_USERNAME", "ESIGNER_PASSWORD", "ESIGNER_TOTP_SECRET")
+
+
 def check_signing_environment(env: Optional[EnvConfig] = None) -> bool:
     """Check if Windows signing environment is properly configured
 
@@ -265,14 +295,7 @@ def check_signing_environment(env: Optional[EnvConfig] = None) -> bool:
         log_error("CODE_SIGN_TOOL_EXE or CODE_SIGN_TOOL_PATH not set")
         return False
 
-    missing = []
-    if not env.esigner_username:
-        missing.append("ESIGNER_USERNAME")
-    if not env.esigner_password:
-        missing.append("ESIGNER_PASSWORD")
-    if not env.esigner_totp_secret:
-        missing.append("ESIGNER_TOTP_SECRET")
-
+    missing = env.missing_vars(*SIGNING_ENV_VARS)
     if missing:
         log_error(f"Missing environment variables: {', '.join(missing)}")
         return False
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Storage modules for R2 upload/download operations"""
 
+from importlib import import_module
+
 from .r2 import (
     BOTO3_AVAILABLE,
     get_r2_client,
@@ -10,8 +12,26 @@ from .r2 import (
     get_release_json,
 )
 
-from .upload import UploadModule
-from .download import DownloadResourcesModule
+# Pipeline modules are loaded on first access (PEP 562), so the release and
+# OTA CLIs, which only need the R2 helpers, don't import them
+_LAZY_MODULES = {
+    "UploadModule": ".upload",
+    "DownloadResourcesModule": ".download",
+}
+
+
+def __getattr__(name: str):
+    submodule = _LAZY_MODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
 
 __all__ = [
     # R2 utilities
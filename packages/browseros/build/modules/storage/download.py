@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """Download module for fetching build resources from Cloudflare R2"""
 
-import yaml
 from pathlib import Path
 from typing import List
 
 from ...common.module import CommandModule, ValidationError
+from ...common.config import load_yaml_file
 from ...common.context import Context
 from ...common.utils import (
     log_info,
@@ -34,9 +34,10 @@ class DownloadResourcesModule(CommandModule):
         - For universal builds on macOS, downloads both arm64 and x64 binaries
     """
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Download resources from Cloudflare R2"
+    parallel_safe = True  # Only writes files listed in download_resources.yaml
 
     def validate(self, context: Context) -> None:
         if not BOTO3_AVAILABLE:
@@ -60,8 +61,7 @@ class DownloadResourcesModule(CommandModule):
         log_info("\nDownloading resources from R2...")
 
         config_path = context.get_download_resources_config()
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = load_yaml_file(config_path)
 
         if "download_operations" not in config:
             log_info("No download_operations defined in configuration")
@@ -120,9 +120,9 @@ class DownloadResourcesModule(CommandModule):
         current_build_type = context.build_type
 
         # For universal builds, we need both arm64 and x64
-        target_archs = [current_arch]
+        target_archs = frozenset({current_arch})
         if current_arch == "universal":
-            target_archs = ["arm64", "x64", "universal"]
+            target_archs = frozenset({"arm64", "x64", "universal"})
 
         filtered = []
 
@@ -136,7 +136,9 @@ class DownloadResourcesModule(CommandModule):
             arch_condition = op.get("arch")
             if arch_condition:
                 # Check if any target arch matches any condition arch
-                if not any(arch in arch_condition for arch in target_archs):
+                if isinstance(arch_condition, str):
+                    arch_condition = (arch_condition,)
+                if target_archs.isdisjoint(arch_condition):
                     continue
 
             # Check build_type condition
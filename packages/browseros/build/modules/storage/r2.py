@@ -5,26 +5,38 @@ This module provides shared R2 (S3-compatible) operations used by both
 upload and download modules.
 """
 
+import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from ...common.env import EnvConfig
 from ...common.utils import log_info, log_error, log_success, log_warning
 
-# Try to import boto3 for R2 (S3-compatible)
-try:
-    import boto3
-    from botocore.config import Config
+# Probe for boto3 (R2 is S3-compatible) without importing it; boto3 is only
+# imported when a client is actually created, keeping CLI startup fast
+BOTO3_AVAILABLE = find_spec("boto3") is not None
 
-    BOTO3_AVAILABLE = True
-except ImportError:
-    BOTO3_AVAILABLE = False
+# Large artifacts are sent as multipart uploads: big parts amortize per-request
+# overhead, and several parts of one file stream concurrently
+MULTIPART_CHUNK_SIZE = 96 * 1024 * 1024
+MULTIPART_CONCURRENCY = 8
+# Number of artifacts uploaded at once (see upload_release_artifacts)
+UPLOAD_WORKERS = 4
+# Object metadata key holding the SHA-256 of the uploaded file
+CHECKSUM_METADATA_KEY = "sha256"
 
 
 def get_r2_client(env: Optional[EnvConfig] = None):
     """Create boto3 S3 client configured for R2
 
+    Clients are cached per set of credentials, so repeated uploads and
+    downloads in one run (e.g. each architecture of a universal build) share
+    a single client and its connection pool.
+
     Args:
         env: Optional EnvConfig instance. If not provided, creates a new one.
 
@@ -42,23 +54,55 @@ def get_r2_client(env: Optional[EnvConfig] = None):
         log_error("R2 configuration not set")
         return None
 
+    return _create_r2_client(
+        env.r2_endpoint_url, env.r2_access_key_id, env.r2_secret_access_key
+    )
+
+
+@lru_cache(maxsize=4)
+def _create_r2_client(
+    endpoint_url: str, access_key_id: str, secret_access_key: str
+):
+    """Build the boto3 client for get_r2_client (cached per credentials)"""
+    import boto3
+    from botocore.config import Config
+
     return boto3.client(
         "s3",
-        endpoint_url=env.r2_endpoint_url,
-        aws_access_key_id=env.r2_access_key_id,
-        aws_secret_access_key=env.r2_secret_access_key,
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
         config=Config(
             signature_version="s3v4",
             retries={"max_attempts": 3, "mode": "standard"},
+            max_pool_connections=UPLOAD_WORKERS * MULTIPART_CONCURRENCY,
         ),
     )
 
 
+def _file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file, read in chunks"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _r2_object_fingerprint(
+    client, bucket: str, r2_key: str
+) -> Optional[Tuple[int, Optional[str]]]:
+    """(size, recorded checksum) of the object at r2_key, or None if absent"""
+    try:
+        head = client.head_object(Bucket=bucket, Key=r2_key)
+    except client.exceptions.ClientError:
+        return None
+    return head.get("ContentLength"), head.get("Metadata", {}).get(CHECKSUM_METADATA_KEY)
+
+
 def upload_file_to_r2(
     client,
     local_path: Path,
     r2_key: str,
     bucket: str,
+    skip_unchanged: bool = False,
 ) -> bool:
     """Upload a single file to R2
 
@@ -67,13 +111,38 @@ def upload_file_to_r2(
         local_path: Path to local file
         r2_key: Key (path) in R2 bucket
         bucket: R2 bucket name
+        skip_unchanged: Record the file's SHA-256 on the object and skip the
+            upload when the object already has the same size and checksum
 
     Returns:
         True if successful, False otherwise
     """
+    from boto3.s3.transfer import TransferConfig
+
+    config = TransferConfig(
+        multipart_threshold=MULTIPART_CHUNK_SIZE,
+        multipart_chunksize=MULTIPART_CHUNK_SIZE,
+        max_concurrency=MULTIPART_CONCURRENCY,
+    )
+
     try:
+        extra_args = None
+        if skip_unchanged:
+            # Hash locally while the HEAD request is in flight
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                remote = executor.submit(_r2_object_fingerprint, client, bucket, r2_key)
+                checksum = _file_sha256(local_path)
+                size = local_path.stat().st_size
+                fingerprint = remote.result()
+            if fingerprint == (size, checksum):
+                log_success(f"Already uploaded, skipping: {r2_key}")
+                return True
+            extra_args = {"Metadata": {CHECKSUM_METADATA_KEY: checksum}}
+
         log_info(f"Uploading {local_path.name}...")
-        client.upload_file(str(local_path), bucket, r2_key)
+        client.upload_file(
+            str(local_path), bucket, r2_key, ExtraArgs=extra_args, Config=config
+        )
         log_success(f"Uploaded: {r2_key}")
         return True
     except Exception as e:
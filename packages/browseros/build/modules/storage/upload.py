@@ -2,6 +2,8 @@
 """Upload module for BrowserOS build artifacts to Cloudflare R2"""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -13,33 +15,38 @@ from ...common.utils import (
     log_error,
     log_success,
     log_warning,
-    IS_WINDOWS,
-    IS_MACOS,
+    get_platform,
 )
 from ...common.notify import get_notifier, COLOR_GREEN
 
 from .r2 import (
     BOTO3_AVAILABLE,
+    UPLOAD_WORKERS,
     get_r2_client,
     upload_file_to_r2,
 )
 
 
+# get_platform() value -> platform name used in R2 paths
+R2_PLATFORM_NAMES = {"macos": "macos", "windows": "win", "linux": "linux"}
+# get_platform() value -> file suffixes of its release artifacts
+ARTIFACT_SUFFIXES = {
+    "macos": (".dmg",),
+    "windows": (".exe", ".zip"),
+    "linux": (".AppImage", ".deb"),
+}
+
+
 def _get_platform() -> str:
     """Get platform name for R2 path"""
-    if IS_MACOS():
-        return "macos"
-    elif IS_WINDOWS():
-        return "win"
-    else:
-        return "linux"
+    return R2_PLATFORM_NAMES.get(get_platform(), "linux")
 
 
 class UploadModule(CommandModule):
     """Upload build artifacts to Cloudflare R2"""
 
-    produces = []
-    requires = []
+    produces = frozenset()
+    requires = frozenset()
     description = "Upload build artifacts to Cloudflare R2"
 
     def validate(self, ctx: Context) -> None:
@@ -161,21 +168,19 @@ def detect_artifacts(ctx: Context) -> List[Path]:
     Returns:
         List of artifact file paths found
     """
-    dist_dir = ctx.get_dist_dir()
-    if not dist_dir.exists():
+    suffixes = ARTIFACT_SUFFIXES.get(get_platform(), ARTIFACT_SUFFIXES["linux"])
+
+    # One directory listing for all suffixes instead of a glob per suffix
+    try:
+        with os.scandir(ctx.get_dist_dir()) as entries:
+            artifacts = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(suffixes) and not entry.name.startswith(".")
+            ]
+    except FileNotFoundError:
         return []
 
-    artifacts = []
-
-    if IS_MACOS():
-        artifacts.extend(dist_dir.glob("*.dmg"))
-    elif IS_WINDOWS():
-        artifacts.extend(dist_dir.glob("*.exe"))
-        artifacts.extend(dist_dir.glob("*.zip"))
-    else:  # Linux
-        artifacts.extend(dist_dir.glob("*.AppImage"))
-        artifacts.extend(dist_dir.glob("*.deb"))
-
     return sorted(artifacts)
 
 
@@ -222,13 +227,28 @@ def upload_release_artifacts(
         log_error("Failed to create R2 client")
         return False, None
 
+    # boto3 clients are thread-safe, so artifacts upload concurrently.
+    # Re-runs of the same build skip artifacts R2 already has.
+    with ThreadPoolExecutor(
+        max_workers=min(UPLOAD_WORKERS, len(artifacts))
+    ) as executor:
+        uploaded = list(
+            executor.map(
+                lambda path: upload_file_to_r2(
+                    client,
+                    path,
+                    f"{release_path}{path.name}",
+                    env.r2_bucket,
+                    skip_unchanged=True,
+                ),
+                artifacts,
+            )
+        )
+    if not all(uploaded):
+        return False, None
+
     artifact_metadata = []
     for artifact_path in artifacts:
-        r2_key = f"{release_path}{artifact_path.name}"
-
-        if not upload_file_to_r2(client, artifact_path, r2_key, env.r2_bucket):
-            return False, None
-
         metadata = {
             "filename": artifact_path.name,
             "size": artifact_path.stat().st_size,